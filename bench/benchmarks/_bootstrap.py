@@ -0,0 +1,24 @@
+"""Import path setup shared by the benchmark scripts.
+
+Importing this module puts the bench directory (for ``fixtures``) on
+sys.path, plus the in-repo python-sag sources unless sag is already
+installed (e.g. ``pip install -e python-sag``). Each path is added at most
+once, however many benchmarks are run in the same interpreter.
+"""
+
+import importlib.util
+import os
+import sys
+
+_BENCH_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SAG_SRC = os.path.abspath(os.path.join(_BENCH_DIR, "..", "python-sag", "src"))
+
+
+def _add_path(path: str) -> None:
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+_add_path(_BENCH_DIR)
+if importlib.util.find_spec("sag") is None:
+    _add_path(_SAG_SRC)
@@ -4,25 +4,76 @@ Compare linear (everything in context) vs SAG+folding."""
 
 import csv
 import os
-import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable
+from itertools import accumulate, count
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python-sag", "src"))
+import _bootstrap  # noqa: F401
 
 from sag.parser import SAGMessageParser
 from sag.minifier import MessageMinifier
 from sag.fold import FoldEngine
 
+_AGENTS = ("agent0", "agent1")
+
 
 def generate_message(turn: int) -> str:
     """Generate a realistic SAG message for a given turn."""
-    src = f"agent{turn % 2}"
-    dst = f"agent{(turn + 1) % 2}"
-    corr = f" corr=msg{turn - 1}" if turn > 0 else ""
-    stmts = [f'DO action{turn}("argument_{turn}", detail="This is turn {turn} of the conversation with some realistic content")']
+    turn_s = str(turn)
+    src = _AGENTS[turn & 1]
+    dst = _AGENTS[(turn + 1) & 1]
+    corr = " corr=msg" + str(turn - 1) if turn > 0 else ""
+    parts = [
+        "H v 1 id=msg", turn_s, " src=", src, " dst=", dst, " ts=", str(1000 + turn), corr,
+        "\nDO action", turn_s, '("argument_', turn_s,
+        '", detail="This is turn ', turn_s, ' of the conversation with some realistic content")',
+    ]
     if turn % 3 == 0:
-        stmts.append(f'A state.turn = {turn}; A state.progress = {turn * 5}')
-    body = "; ".join(stmts)
-    return f"H v 1 id=msg{turn} src={src} dst={dst} ts={1000 + turn}{corr}\n{body}"
+        parts += ("; A state.turn = ", turn_s, "; A state.progress = ", str(turn * 5))
+    return "".join(parts)
+
+
+def simulate_fold(
+    per_turn: list[int],
+    budget: int,
+    threshold: float,
+    linear_exhausted: int,
+    fold: Callable[[int, int, int], int],
+) -> tuple[array, array]:
+    """Run the fold state machine over per-turn token counts.
+
+    When the context crosses ``budget * threshold``, every unfolded turn but
+    the last two is folded: ``fold(start, end, turn)`` folds turns
+    ``start..end-1`` and returns the token count of the fold message.
+    Stops once both curves are over budget.
+
+    Returns per-turn (context tokens, active folds).
+    """
+    fold_tokens = array("i")
+    fold_counts = array("i")
+    folded = 0  # Tokens held by fold messages
+    n_folds = 0
+    start = 0  # First unfolded turn
+    cumulative = 0
+
+    for turn, tokens in enumerate(per_turn):
+        cumulative += tokens
+
+        if cumulative >= budget * threshold and turn - start > 1:
+            # Fold all but the last 2 messages
+            folded += fold(start, turn - 1, turn)
+            n_folds += 1
+            start = turn - 1
+            cumulative = folded + per_turn[turn - 1] + tokens
+
+        fold_tokens.append(cumulative)
+        fold_counts.append(n_folds)
+
+        if turn >= linear_exhausted and cumulative >= budget:
+            break
+
+    return fold_tokens, fold_counts
 
 
 def run():
@@ -35,71 +86,36 @@ def run():
     threshold = 0.7
     max_turns = 2000
 
-    # Linear: just accumulate everything
-    linear_tokens = []
-    linear_cumulative = 0
+    # Linear: just accumulate everything. Messages and their token counts do
+    # not depend on folding, so the whole linear curve is one running sum.
+    messages = [generate_message(turn) for turn in range(max_turns)]
+    per_turn = [MessageMinifier.count_tokens(m) for m in messages]
+    linear_tokens = list(accumulate(per_turn))
+
+    # The linear curve is sorted, so its budget crossing is known up front
+    linear_exhausted = bisect_left(linear_tokens, budget)
 
     # SAG+Fold: fold when approaching threshold
     fold_engine = FoldEngine()
-    fold_messages_raw = []  # Current unfolded messages
-    fold_active_folds = []  # Active fold summaries
-    fold_tokens = []
-    fold_cumulative = 0
-
-    results = []
 
-    for turn in range(max_turns):
-        msg_text = generate_message(turn)
-        msg_tokens = MessageMinifier.count_tokens(msg_text)
+    def fold(start: int, end: int, turn: int) -> int:
+        parsed = SAGMessageParser.parse_all(messages[start:end])
+        fold_stmt = fold_engine.fold(parsed, f"Turns {turn - (end - start) + 1}-{turn - 2} summary")
+        fold_msg = f'H v 1 id=fold{turn} src=system dst=system ts={2000 + turn}\nFOLD {fold_stmt.fold_id} "Summary of turns"'
+        return MessageMinifier.count_tokens(fold_msg)
 
-        # LINEAR: just add
-        linear_cumulative += msg_tokens
-        linear_tokens.append(linear_cumulative)
+    fold_tokens, fold_counts = simulate_fold(per_turn, budget, threshold, linear_exhausted, fold)
 
-        # SAG+FOLD: add, then check if we need to fold
-        fold_messages_raw.append(msg_text)
-        fold_cumulative += msg_tokens
+    results = [  # (turn, linear_tokens, fold_tokens, active_folds)
+        (turn, linear_tokens[turn], fold_tokens[turn], fold_counts[turn])
+        for turn in range(len(fold_tokens))
+        if turn % 50 == 0 or turn >= linear_exhausted or turn == max_turns - 1
+    ]
 
-        # Check if we should fold
-        if fold_cumulative >= budget * threshold and len(fold_messages_raw) > 2:
-            # Fold all but the last 2 messages
-            to_fold = fold_messages_raw[:-2]
-            parsed = [SAGMessageParser.parse(m) for m in to_fold]
-            fold_stmt = fold_engine.fold(parsed, f"Turns {turn - len(to_fold) + 1}-{turn - 2} summary")
-
-            # Replace folded messages with a single fold statement
-            fold_msg = f'H v 1 id=fold{turn} src=system dst=system ts={2000 + turn}\nFOLD {fold_stmt.fold_id} "Summary of turns"'
-            fold_token_count = MessageMinifier.count_tokens(fold_msg)
-
-            # Calculate new cumulative: fold summaries + remaining raw messages
-            fold_cumulative = fold_token_count
-            for fm in fold_active_folds:
-                fold_cumulative += fm
-            remaining = fold_messages_raw[-2:]
-            for rm in remaining:
-                fold_cumulative += MessageMinifier.count_tokens(rm)
-
-            fold_active_folds.append(fold_token_count)
-            fold_messages_raw = remaining
-
-        fold_tokens.append(fold_cumulative)
-
-        if turn % 50 == 0 or linear_cumulative >= budget or turn == max_turns - 1:
-            row = {
-                "turn": turn,
-                "linear_tokens": linear_cumulative,
-                "fold_tokens": fold_cumulative,
-                "linear_pct": f"{linear_cumulative / budget * 100:.1f}%",
-                "fold_pct": f"{fold_cumulative / budget * 100:.1f}%",
-                "active_folds": fold_engine.get_fold_count(),
-            }
-            results.append(row)
-
-        if linear_cumulative >= budget and fold_cumulative >= budget:
-            break
+    # Only report the turns that were actually simulated
+    del linear_tokens[len(fold_tokens):]
 
-    # Find when each hits budget
-    linear_exhausted = next((i for i, t in enumerate(linear_tokens) if t >= budget), max_turns)
+    # Find when folding hits budget
     fold_exhausted = next((i for i, t in enumerate(fold_tokens) if t >= budget), max_turns)
 
     print(f"Context budget: {budget:,} tokens")
@@ -107,11 +123,10 @@ def run():
     print()
     print(f"{'Turn':>6} {'Linear':>12} {'Linear %':>10} {'SAG+Fold':>12} {'Fold %':>10} {'Folds':>6}")
     print("-" * 60)
-    for r in results:
-        print(
-            f"{r['turn']:>6} {r['linear_tokens']:>12,} {r['linear_pct']:>10} "
-            f"{r['fold_tokens']:>12,} {r['fold_pct']:>10} {r['active_folds']:>6}"
-        )
+    for turn, linear, fold, folds in results:
+        linear_pct = f"{linear / budget * 100:.1f}%"
+        fold_pct = f"{fold / budget * 100:.1f}%"
+        print(f"{turn:>6} {linear:>12,} {linear_pct:>10} {fold:>12,} {fold_pct:>10} {folds:>6}")
     print()
     print(f"Linear exhausts budget at turn: {linear_exhausted}")
     print(f"SAG+Fold exhausts budget at turn: {fold_exhausted}")
@@ -122,11 +137,10 @@ def run():
     reports_dir = os.path.join(os.path.dirname(__file__), "..", "reports")
     os.makedirs(reports_dir, exist_ok=True)
     csv_path = os.path.join(reports_dir, "context_budget.csv")
-    with open(csv_path, "w", newline="") as f:
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(["turn", "linear_tokens", "fold_tokens"])
-        for i in range(min(len(linear_tokens), len(fold_tokens))):
-            writer.writerow([i, linear_tokens[i], fold_tokens[i]])
+        writer.writerows(zip(count(), linear_tokens, fold_tokens))
     print(f"\nCSV written to {csv_path}")
 
     # Try chart
@@ -150,7 +164,7 @@ def run():
         plt.tight_layout()
 
         chart_path = os.path.join(reports_dir, "context_budget.png")
-        plt.savefig(chart_path, dpi=150)
+        plt.savefig(chart_path, dpi=150, pil_kwargs={"compress_level": 1})
         print(f"Chart saved to {chart_path}")
     except ImportError:
         print("matplotlib not available, skipping chart generation")
@@ -3,58 +3,75 @@
 
 import csv
 import os
-import sys
+from dataclasses import dataclass
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python-sag", "src"))
+import _bootstrap  # noqa: F401
 
 from sag.parser import SAGMessageParser
 from sag.minifier import MessageMinifier
 from sag.fold import FoldEngine
+from sag.model import Message
 
+_AGENTS = ("agent0", "agent1", "agent2")
 
-def generate_conversation(n_messages: int) -> list[str]:
+
+@dataclass
+class Conversation:
+    """A conversation stored as parallel per-field lists."""
+
+    messages: list[str]
+    token_counts: list[int]
+
+    @classmethod
+    def from_messages(cls, messages: list[str]) -> "Conversation":
+        return cls(messages, [MessageMinifier.count_tokens(m) for m in messages])
+
+
+def generate_conversation(n_messages: int) -> Conversation:
     """Generate a synthetic N-message conversation."""
     messages = []
     for i in range(n_messages):
-        src = f"agent{i % 3}"
-        dst = f"agent{(i + 1) % 3}"
-        corr = f" corr=msg{i-1}" if i > 0 else ""
-        stmts = [
-            f'DO action{i}("arg{i}", count={i * 10})',
-            f'A state.step = {i}',
-        ]
-        body = "; ".join(stmts)
-        msg = f"H v 1 id=msg{i} src={src} dst={dst} ts={1000 + i}{corr}\n{body}"
-        messages.append(msg)
-    return messages
-
-
-def measure_tokens(messages: list[str]) -> int:
+        i_s = str(i)
+        src = _AGENTS[i % 3]
+        dst = _AGENTS[(i + 1) % 3]
+        corr = " corr=msg" + str(i - 1) if i > 0 else ""
+        messages.append("".join((
+            "H v 1 id=msg", i_s, " src=", src, " dst=", dst, " ts=", str(1000 + i), corr,
+            "\nDO action", i_s, '("arg', i_s, '", count=', str(i * 10), ")",
+            "; A state.step = ", i_s,
+        )))
+    return Conversation.from_messages(messages)
+
+
+def measure_tokens(conv: Conversation) -> int:
     """Count total tokens across all messages."""
-    total = 0
-    for msg in messages:
-        total += MessageMinifier.count_tokens(msg)
-    return total
+    return sum(conv.token_counts)
 
 
-def fold_messages(messages: list[str], fold_size: int) -> list[str]:
-    """Fold messages in groups of fold_size, replacing each group with a FOLD statement."""
-    engine = FoldEngine()
+def fold_messages(engine: FoldEngine, conv: Conversation, parsed: list[Message], fold_size: int) -> Conversation:
+    """Fold messages in groups of fold_size, replacing each group with a FOLD statement.
+
+    ``parsed`` holds the conversation's messages already parsed, so the
+    same conversation can be folded at several sizes without reparsing.
+    """
+    messages = conv.messages
     result = []
+    result_tokens = []
 
     for i in range(0, len(messages), fold_size):
         group = messages[i : i + fold_size]
         if len(group) >= 2:
-            # Parse to get Message objects for fold
-            parsed = [SAGMessageParser.parse(m) for m in group]
-            fold_stmt = engine.fold(parsed, f"Folded messages {i}-{i + len(group) - 1}")
+            fold_stmt = engine.fold(parsed[i : i + fold_size], f"Folded messages {i}-{i + len(group) - 1}")
             # Create a fold message
             fold_msg = f'H v 1 id=fold{i} src=system dst=system ts={2000 + i}\nFOLD {fold_stmt.fold_id} "Folded messages {i}-{i + len(group) - 1}"'
             result.append(fold_msg)
+            result_tokens.append(MessageMinifier.count_tokens(fold_msg))
         else:
+            # Unfolded tail: carry the precomputed token counts over
             result.extend(group)
+            result_tokens.extend(conv.token_counts[i : i + fold_size])
 
-    return result
+    return Conversation(result, result_tokens)
 
 
 def run():
@@ -67,19 +84,22 @@ def run():
     fold_sizes = [5, 10, 25, 50]
 
     results = []
+    engine = FoldEngine()
 
     print(f"{'Conv Size':>10} {'Fold Size':>10} {'Original':>10} {'Folded':>10} {'Ratio':>10} {'Savings':>10}")
     print("-" * 65)
 
     for conv_size in conversation_sizes:
-        messages = generate_conversation(conv_size)
-        original_tokens = measure_tokens(messages)
+        conv = generate_conversation(conv_size)
+        original_tokens = measure_tokens(conv)
+        parsed = SAGMessageParser.parse_all(conv.messages)
 
         for fold_size in fold_sizes:
             if fold_size >= conv_size:
                 continue
 
-            folded = fold_messages(messages, fold_size)
+            engine.clear()
+            folded = fold_messages(engine, conv, parsed, fold_size)
             folded_tokens = measure_tokens(folded)
             ratio = folded_tokens / original_tokens if original_tokens > 0 else 0
             savings = (1 - ratio) * 100
@@ -133,7 +153,7 @@ def run():
         plt.tight_layout()
 
         chart_path = os.path.join(reports_dir, "fold_compression.png")
-        plt.savefig(chart_path, dpi=150)
+        plt.savefig(chart_path, dpi=150, pil_kwargs={"compress_level": 1})
         print(f"Chart saved to {chart_path}")
     except ImportError:
         print("matplotlib not available, skipping chart generation")
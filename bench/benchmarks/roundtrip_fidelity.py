@@ -1,16 +1,55 @@
 #!/usr/bin/env python3
 """Measure fold -> unfold -> diff fidelity."""
 
-import os
-import sys
+from concurrent.futures import ProcessPoolExecutor
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python-sag", "src"))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import _bootstrap  # noqa: F401
 
-from sag.parser import SAGMessageParser
+from sag.model import Message
 from sag.minifier import MessageMinifier
 from sag.fold import FoldEngine
-from fixtures.conversations import CONVERSATIONS
+from sag.parser import SAGMessageParser
+from fixtures.conversations import NAMES, load_parsed_conversations
+
+
+def _check_conversation(name: str, parsed: list[Message]) -> tuple[int, int, list[str]]:
+    """Fold and unfold one parsed conversation with its own engine.
+
+    Returns (messages checked, perfect roundtrips, report lines).
+    """
+    engine = FoldEngine()
+    lines = []
+
+    # Fold all messages
+    fold_stmt = engine.fold(parsed, f"Summary of {name}")
+
+    # Unfold
+    unfolded = engine.unfold(fold_stmt.fold_id)
+
+    if unfolded is None:
+        return 0, 0, [f"  FAIL: {name} - unfold returned None"]
+
+    # Compare
+    n_messages = 0
+    n_perfect = 0
+    for i, (orig, restored) in enumerate(zip(parsed, unfolded)):
+        n_messages += 1
+
+        # Send the restored message over the wire and back, so any loss in
+        # minifying or parsing shows up in the comparison
+        orig_min = MessageMinifier.to_minified_string(orig)
+        reparsed = SAGMessageParser.parse(MessageMinifier.to_minified_string(restored))
+        restored_min = MessageMinifier.to_minified_string(reparsed)
+        if reparsed == orig and orig_min == restored_min:
+            n_perfect += 1
+        else:
+            lines.append(f"  DIFF in {name} message {i}:")
+            lines.append(f"    Original: {orig_min[:80]}...")
+            lines.append(f"    Restored: {restored_min[:80]}...")
+
+    status = "PERFECT" if n_perfect == n_messages else "DIFF"
+    lines.append(f"  [{status}] {name}: {len(parsed)} messages")
+    return n_messages, n_perfect, lines
 
 
 def run():
@@ -19,41 +58,16 @@ def run():
     print("=" * 80)
     print()
 
-    engine = FoldEngine()
     total_messages = 0
     total_perfect = 0
 
-    for conv in CONVERSATIONS:
-        name = conv["name"]
-        parsed = [SAGMessageParser.parse(m) for m in conv["sag"]]
-
-        # Fold all messages
-        fold_stmt = engine.fold(parsed, f"Summary of {name}")
-
-        # Unfold
-        unfolded = engine.unfold(fold_stmt.fold_id)
-
-        if unfolded is None:
-            print(f"  FAIL: {name} - unfold returned None")
-            continue
-
-        # Compare
-        perfect = True
-        for i, (orig, restored) in enumerate(zip(parsed, unfolded)):
-            orig_min = MessageMinifier.to_minified_string(orig)
-            restored_min = MessageMinifier.to_minified_string(restored)
-            total_messages += 1
-
-            if orig_min == restored_min:
-                total_perfect += 1
-            else:
-                perfect = False
-                print(f"  DIFF in {name} message {i}:")
-                print(f"    Original: {orig_min[:80]}...")
-                print(f"    Restored: {restored_min[:80]}...")
-
-        status = "PERFECT" if perfect else "DIFF"
-        print(f"  [{status}] {name}: {len(parsed)} messages")
+    # Conversations are independent, so check them in parallel
+    with ProcessPoolExecutor() as executor:
+        for n_messages, n_perfect, lines in executor.map(_check_conversation, NAMES, load_parsed_conversations()):
+            total_messages += n_messages
+            total_perfect += n_perfect
+            for line in lines:
+                print(line)
 
     print()
     print(f"Total messages: {total_messages}")
@@ -2,29 +2,34 @@
 """Compare token counts across SAG, JSON, and natural language formats."""
 
 import csv
-import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "python-sag", "src"))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import _bootstrap  # noqa: F401
 
-from fixtures.conversations import CONVERSATIONS
+from fixtures.conversations import JSON_MESSAGES, NAMES, NL_MESSAGES, SAG_MESSAGES, get_conversations
 
 
-def chars_to_tokens(text: str) -> int:
-    """Approximate token count using chars/4 heuristic."""
-    import math
-    return math.ceil(len(text) / 4.0)
+def chars_to_tokens(n_chars: int) -> int:
+    """Approximate token count from a character count using chars/4 heuristic."""
+    return -(-n_chars // 4)
 
 
-def try_tiktoken(text: str) -> int | None:
-    """Try to count tokens with tiktoken if available."""
-    try:
-        import tiktoken
-        enc = tiktoken.get_encoding("cl100k_base")
-        return len(enc.encode(text))
-    except ImportError:
-        return None
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _ENCODING = None
+
+
+def try_tiktoken_batch(columns: tuple[tuple[tuple[str, ...], ...], ...]) -> list[list[int | None]]:
+    """Count tokens of every joined conversation in each column with one tiktoken call, if available."""
+    if _ENCODING is None:
+        return [[None] * len(column) for column in columns]
+    texts = ["\n".join(messages) for column in columns for messages in column]
+    encoded = _ENCODING.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+    counts = [len(tokens) for tokens in encoded]
+    n = len(columns[0])
+    return [counts[i : i + n] for i in range(0, len(counts), n)]
 
 
 def run():
@@ -33,50 +38,50 @@ def run():
     print("=" * 80)
     print()
 
-    results = []
-    totals = {"sag_chars": 0, "json_chars": 0, "nl_chars": 0, "sag_tokens": 0, "json_tokens": 0, "nl_tokens": 0}
-
-    for conv in CONVERSATIONS:
-        sag_text = "\n".join(conv["sag"])
-        json_text = "\n".join(conv["json"])
-        nl_text = "\n".join(conv["nl"])
-
-        sag_chars = len(sag_text)
-        json_chars = len(json_text)
-        nl_chars = len(nl_text)
-
-        sag_tokens = chars_to_tokens(sag_text)
-        json_tokens = chars_to_tokens(json_text)
-        nl_tokens = chars_to_tokens(nl_text)
-
-        # Try tiktoken for more accurate counts
-        sag_tiktoken = try_tiktoken(sag_text)
-        json_tiktoken = try_tiktoken(json_text)
-        nl_tiktoken = try_tiktoken(nl_text)
-
-        row = {
-            "name": conv["name"],
-            "messages": len(conv["sag"]),
-            "sag_chars": sag_chars,
-            "json_chars": json_chars,
-            "nl_chars": nl_chars,
-            "sag_tokens_heuristic": sag_tokens,
-            "json_tokens_heuristic": json_tokens,
-            "nl_tokens_heuristic": nl_tokens,
-            "sag_tokens_tiktoken": sag_tiktoken,
-            "json_tokens_tiktoken": json_tiktoken,
-            "nl_tokens_tiktoken": nl_tiktoken,
-            "sag_vs_json_savings": f"{((json_chars - sag_chars) / json_chars * 100):.1f}%",
-            "sag_vs_nl_savings": f"{((nl_chars - sag_chars) / nl_chars * 100):.1f}%",
-        }
-        results.append(row)
+    conversations = get_conversations()
+
+    # Joined-text lengths are precomputed by the fixtures
+    sag_chars = [conv["sag_chars"] for conv in conversations]
+    json_chars = [conv["json_chars"] for conv in conversations]
+    nl_chars = [conv["nl_chars"] for conv in conversations]
+    sag_tokens = [chars_to_tokens(n) for n in sag_chars]
+    json_tokens = [chars_to_tokens(n) for n in json_chars]
+    nl_tokens = [chars_to_tokens(n) for n in nl_chars]
 
-        totals["sag_chars"] += sag_chars
-        totals["json_chars"] += json_chars
-        totals["nl_chars"] += nl_chars
-        totals["sag_tokens"] += sag_tokens
-        totals["json_tokens"] += json_tokens
-        totals["nl_tokens"] += nl_tokens
+    # tiktoken counts (None when tiktoken is not installed)
+    sag_tiktoken, json_tiktoken, nl_tiktoken = try_tiktoken_batch(
+        (SAG_MESSAGES, JSON_MESSAGES, NL_MESSAGES)
+    )
+    sag_vs_json = [(j - s) / j * 100 for s, j in zip(sag_chars, json_chars)]
+    sag_vs_nl = [(n - s) / n * 100 for s, n in zip(sag_chars, nl_chars)]
+
+    totals = {
+        "sag_chars": sum(sag_chars),
+        "json_chars": sum(json_chars),
+        "nl_chars": sum(nl_chars),
+        "sag_tokens": sum(sag_tokens),
+        "json_tokens": sum(json_tokens),
+        "nl_tokens": sum(nl_tokens),
+    }
+
+    results = [
+        {
+            "name": NAMES[i],
+            "messages": conv["msg_count"],
+            "sag_chars": sag_chars[i],
+            "json_chars": json_chars[i],
+            "nl_chars": nl_chars[i],
+            "sag_tokens_heuristic": sag_tokens[i],
+            "json_tokens_heuristic": json_tokens[i],
+            "nl_tokens_heuristic": nl_tokens[i],
+            "sag_tokens_tiktoken": sag_tiktoken[i],
+            "json_tokens_tiktoken": json_tiktoken[i],
+            "nl_tokens_tiktoken": nl_tiktoken[i],
+            "sag_vs_json_savings": f"{sag_vs_json[i]:.1f}%",
+            "sag_vs_nl_savings": f"{sag_vs_nl[i]:.1f}%",
+        }
+        for i, conv in enumerate(conversations)
+    ]
 
     # Print table
     print(f"{'Conversation':<35} {'Msgs':>5} {'SAG':>8} {'JSON':>8} {'NL':>8} {'SAG vs JSON':>12} {'SAG vs NL':>10}")
@@ -136,7 +141,7 @@ def run():
         plt.tight_layout()
 
         chart_path = os.path.join(reports_dir, "token_efficiency.png")
-        plt.savefig(chart_path, dpi=150)
+        plt.savefig(chart_path, dpi=150, pil_kwargs={"compress_level": 1})
         print(f"Chart saved to {chart_path}")
     except ImportError:
         print("matplotlib not available, skipping chart generation")
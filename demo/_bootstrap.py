@@ -0,0 +1,16 @@
+"""Import path setup shared by the demo entry points.
+
+The demo expects sag to be installed (``pip install -r requirements.txt``
+installs python-sag in editable mode). When it is not, importing this
+module falls back to the in-repo python-sag sources. The path is added at
+most once, however many demo modules import this one.
+"""
+
+import importlib.util
+import os
+import sys
+
+_SAG_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
+
+if importlib.util.find_spec("sag") is None and _SAG_SRC not in sys.path:
+    sys.path.insert(0, _SAG_SRC)
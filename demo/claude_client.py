@@ -3,31 +3,38 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from functools import cached_property
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
 
 
 class ClaudeClient:
     def __init__(self, api_key: str | None = None, model: str = "claude-sonnet-4-20250514"):
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         self._model = model
-        self._client = None
 
-    def _ensure_client(self):
-        if self._client is None:
-            try:
-                import anthropic
-                self._client = anthropic.Anthropic(api_key=self._api_key)
-            except ImportError:
-                raise RuntimeError("anthropic package not installed. Run: pip install anthropic")
+    @cached_property
+    def _client(self):
+        if anthropic is None:
+            raise RuntimeError("anthropic package not installed. Run: pip install anthropic")
+        return anthropic.Anthropic(api_key=self._api_key)
 
     def complete(self, system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> str:
-        self._ensure_client()
-        response = self._client.messages.create(
+        return "".join(self.complete_stream(system_prompt, messages, max_tokens))
+
+    def complete_stream(self, system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
+        """Yield the response text as it is generated."""
+        with self._client.messages.stream(
             model=self._model,
             max_tokens=max_tokens,
             system=system_prompt,
             messages=messages,
-        )
-        return response.content[0].text
+        ) as stream:
+            yield from stream.text_stream
 
     @property
     def model(self) -> str:
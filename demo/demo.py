@@ -3,14 +3,14 @@
 
 from __future__ import annotations
 
-import argparse
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import NoReturn
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
-
+import _bootstrap  # noqa: F401
 from root_agent import RootAgent
-from ui import DemoUI
 
 PROVIDER_DEFAULTS = {
     "claude": "claude-sonnet-4-20250514",
@@ -23,18 +23,76 @@ ENV_KEY_NAMES = {
 }
 
 
+USAGE = """usage: demo.py [-h] [--provider {claude,openai}] [--api-key API_KEY] [--model MODEL]
+               [--budget BUDGET] [--threshold THRESHOLD] [--no-api]
+
+SAG Live Demo - Chatbot with fold/unfold
+
+options:
+  -h, --help            show this help message and exit
+  --provider {claude,openai}
+                        LLM provider
+  --api-key API_KEY     API key (or set ANTHROPIC_API_KEY / OPENAI_API_KEY)
+  --model MODEL         Model to use (default depends on provider)
+  --budget BUDGET       Token budget
+  --threshold THRESHOLD
+                        Fold threshold (0-1)
+  --no-api              Run without LLM API (echo mode)"""
+
+# Value-taking options and how to convert their value
+_VALUE_OPTIONS = {
+    "--provider": str,
+    "--api-key": str,
+    "--model": str,
+    "--budget": int,
+    "--threshold": float,
+}
+
+
+def _usage_error(message: str) -> NoReturn:
+    print(USAGE.split("\n\n", 1)[0], file=sys.stderr)
+    print(f"demo.py: error: {message}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def parse_argv(argv: list[str]) -> SimpleNamespace:
+    """Parse the demo's command line (a small fixed flag set, so no argparse)."""
+    args = SimpleNamespace(provider="claude", api_key=None, model=None, budget=10000, threshold=0.7, no_api=False)
+    it = iter(argv)
+    for tok in it:
+        if tok in ("-h", "--help"):
+            print(USAGE)
+            raise SystemExit(0)
+        if tok == "--no-api":
+            args.no_api = True
+            continue
+
+        name, eq, value = tok.partition("=")
+        convert = _VALUE_OPTIONS.get(name)
+        if convert is None:
+            _usage_error(f"unrecognized arguments: {tok}")
+        if not eq:
+            value = next(it, None)
+            if value is None:
+                _usage_error(f"argument {name}: expected one argument")
+        try:
+            setattr(args, name[2:].replace("-", "_"), convert(value))
+        except ValueError:
+            _usage_error(f"argument {name}: invalid {convert.__name__} value: {value!r}")
+
+    if args.provider not in PROVIDER_DEFAULTS:
+        _usage_error(f"argument --provider: invalid choice: {args.provider!r} (choose from 'claude', 'openai')")
+    return args
+
+
 def main():
-    parser = argparse.ArgumentParser(description="SAG Live Demo - Chatbot with fold/unfold")
-    parser.add_argument("--provider", choices=["claude", "openai"], default="claude", help="LLM provider")
-    parser.add_argument("--api-key", help="API key (or set ANTHROPIC_API_KEY / OPENAI_API_KEY)")
-    parser.add_argument("--model", default=None, help="Model to use (default depends on provider)")
-    parser.add_argument("--budget", type=int, default=10000, help="Token budget")
-    parser.add_argument("--threshold", type=float, default=0.7, help="Fold threshold (0-1)")
-    parser.add_argument("--no-api", action="store_true", help="Run without LLM API (echo mode)")
-    args = parser.parse_args()
+    args = parse_argv(sys.argv[1:])
 
     model = args.model or PROVIDER_DEFAULTS[args.provider]
 
+    # rich is imported only once we get past argument parsing
+    from ui import DemoUI
+
     ui = DemoUI()
     ui.print_header()
 
@@ -60,36 +118,61 @@ def main():
 
     agent = RootAgent(claude_client=client, budget=args.budget, threshold=args.threshold)
 
+    # Folding (which may call the LLM for a summary) runs on a worker thread
+    # while the user types the next message
+    pending_fold: Future | None = None
+
     try:
-        while True:
-            try:
-                user_input = input("You: ").strip()
-            except EOFError:
-                break
-
-            if not user_input:
-                continue
-
-            # Handle RECALL command
-            if user_input.upper().startswith("RECALL "):
-                fold_id = user_input.split(" ", 1)[1].strip()
-                content = agent.process_recall(fold_id)
-                ui.print_recall_result(fold_id, content)
-                continue
-
-            # Process normal input
-            response, fold_events = agent.process_input(user_input)
-
-            # Show fold events
-            for event in fold_events:
-                ui.print_fold_event(event)
-
-            # Show response
-            ui.print_agent_response(response)
-
-            # Show metrics
-            metrics = agent.memory.get_metrics()
-            ui.print_metrics(metrics)
+        with ThreadPoolExecutor(max_workers=1) as fold_worker:
+            while True:
+                try:
+                    user_input = input("You: ").strip()
+                except EOFError:
+                    break
+
+                # The agent must not be used while a background fold is running
+                if pending_fold is not None:
+                    try:
+                        fold_events = pending_fold.result()
+                    except Exception as e:
+                        # A failed fold leaves the history unfolded; keep chatting
+                        fold_events = [f"Fold failed: {e}"]
+                    pending_fold = None
+                    for event in fold_events:
+                        ui.print_fold_event(event)
+                    # The metrics printed last turn predate this fold
+                    if fold_events:
+                        ui.print_metrics(agent.memory.get_metrics())
+
+                if not user_input:
+                    continue
+
+                # Handle RECALL command
+                if user_input.upper().startswith("RECALL "):
+                    fold_id = user_input.split(" ", 1)[1].strip()
+                    content = agent.process_recall(fold_id)
+                    ui.print_recall_result(fold_id, content)
+                    continue
+
+                # Process normal input
+                response, fold_events = agent.process_input(user_input, on_chunk=ui.print_agent_chunk)
+
+                streamed = ui.end_agent_stream()
+
+                # Show fold events
+                for event in fold_events:
+                    ui.print_fold_event(event)
+
+                # Show response, unless it was already streamed
+                if not streamed:
+                    ui.print_agent_response(response)
+
+                # Show metrics
+                metrics = agent.memory.get_metrics()
+                ui.print_metrics(metrics)
+
+                # Fold ahead of the next turn, overlapping with the user's typing
+                pending_fold = fold_worker.submit(agent.fold_if_needed)
 
     except KeyboardInterrupt:
         pass
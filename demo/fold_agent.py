@@ -2,35 +2,36 @@
 
 from __future__ import annotations
 
-import json
-import sys
 import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from sag.minifier import MessageMinifier
-from sag.model import AssertStatement, Message
+from sag.model import ActionStatement, AssertStatement, EventStatement, Message
 from sag.fold import FoldEngine
 
+_PROMPT_PATH = os.path.join(os.path.dirname(__file__), "prompts", "fold_system.txt")
+try:
+    with open(_PROMPT_PATH, encoding="utf-8") as f:
+        _SYSTEM_PROMPT = f.read()
+except FileNotFoundError:
+    _SYSTEM_PROMPT = ""
+
 
 class FoldAgent:
     def __init__(self, claude_client: object | None = None):
         self._client = claude_client
         self._engine = FoldEngine()
-        self._system_prompt = ""
-
-        prompt_path = os.path.join(os.path.dirname(__file__), "prompts", "fold_system.txt")
-        if os.path.exists(prompt_path):
-            with open(prompt_path) as f:
-                self._system_prompt = f.read()
+        self._system_prompt = _SYSTEM_PROMPT
 
     def fold(self, messages: list[Message], state: dict | None = None) -> tuple[str, int, int, dict]:
         """Fold messages, return (fold_id, original_tokens, fold_tokens, facts)."""
         # Count original tokens
-        original_tokens = sum(
-            MessageMinifier.count_tokens(MessageMinifier.to_minified_string(m))
-            for m in messages
-        )
+        msg_texts = [MessageMinifier.to_minified_string(m) for m in messages]
+        original_tokens = sum(MessageMinifier.count_tokens_batch(msg_texts))
 
         # Generate summary and extract facts
         summary, facts = self._generate_summary(messages)
@@ -48,18 +49,21 @@ class FoldAgent:
 
         return fold_stmt.fold_id, original_tokens, fold_tokens, merged_state
 
-    def unfold(self, fold_id: str) -> list[Message] | None:
+    def unfold(self, fold_id: str) -> tuple[Message, ...] | None:
         return self._engine.unfold(fold_id)
 
     def _generate_summary(self, messages: list[Message]) -> tuple[str, dict]:
         """Generate a summary and extract facts. Returns (summary, facts)."""
         if self._client:
             try:
-                msg_texts = [MessageMinifier.to_minified_string(m) for m in messages]
-                combined = "\n---\n".join(msg_texts)
+                parts = ["Summarize these SAG messages:\n"]
+                for i, m in enumerate(messages):
+                    if i:
+                        parts.append("\n---\n")
+                    parts.append(MessageMinifier.to_minified_string(m))
                 result = self._client.complete(
                     self._system_prompt,
-                    [{"role": "user", "content": f"Summarize these SAG messages:\n{combined}"}],
+                    [{"role": "user", "content": "".join(parts)}],
                     max_tokens=256,
                 )
                 return self._parse_summary_response(result)
@@ -78,32 +82,36 @@ class FoldAgent:
         facts = {}
         if len(lines) >= 2:
             try:
-                facts = json.loads(lines[1].strip())
+                facts = _json_loads(lines[1])
                 if not isinstance(facts, dict):
                     facts = {}
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:  # json and orjson decode errors both subclass it
                 pass
         return summary, facts
 
     def _extract_facts_from_assertions(self, messages: list[Message]) -> dict:
         """Fallback fact extraction: scan AssertStatements for key-value facts."""
-        facts = {}
-        for msg in messages:
-            for stmt in msg.statements:
-                if isinstance(stmt, AssertStatement) and stmt.path and stmt.value:
-                    # Keep assertion values that look like meaningful facts
-                    if stmt.path != "response" and isinstance(stmt.value, str) and len(stmt.value) < 200:
-                        facts[stmt.path] = stmt.value
-        return facts
+        # Keep non-empty string assertions that look like meaningful facts;
+        # later messages overwrite earlier values for the same path
+        return {
+            stmt.path: stmt.value
+            for msg in messages
+            for stmt in msg.statements
+            if type(stmt) is AssertStatement
+            and stmt.path
+            and stmt.path != "response"
+            and isinstance(stmt.value, str)
+            and 0 < len(stmt.value) < 200
+        }
 
     def _fallback_summary(self, messages: list[Message]) -> str:
         """Generate a basic summary without LLM."""
         verbs = []
         for msg in messages:
             for stmt in msg.statements:
-                if hasattr(stmt, "verb"):
+                if isinstance(stmt, ActionStatement):
                     verbs.append(stmt.verb)
-                elif hasattr(stmt, "event_name"):
+                elif isinstance(stmt, EventStatement):
                     verbs.append(f"evt:{stmt.event_name}")
 
         if verbs:
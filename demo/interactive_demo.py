@@ -5,14 +5,10 @@ from __future__ import annotations
 
 import argparse
 import os
-import sys
 import tempfile
+from typing import TYPE_CHECKING
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
-
-from rich.console import Console
-from rich.panel import Panel
-from rich import box
+import _bootstrap  # noqa: F401
 
 from sag.tree import TreeEngine
 from sag.grove import (
@@ -23,24 +19,36 @@ from sag.grove import (
     LLMAgentRunner,
 )
 from sag.checkpoint import CheckpointManager
-from tree_ui import TreeUI
+from response_cache import CachedClient, ResponseCache
+
+if TYPE_CHECKING:
+    from tree_ui import TreeUI
 
 # Reuse tree configuration from tree_demo
-from tree_demo import build_grove_tree, PROVIDER_DEFAULTS, ENV_KEY_NAMES
+from tree_demo import build_grove_tree, PROVIDER_DEFAULTS, ENV_KEY_NAMES, PARALLEL_WORKERS
 
 
-def _run_step_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str) -> None:
+def _run_step_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str, max_workers: int = 1) -> None:
     """Interactive step-through execution."""
-    mgr = CheckpointManager(cp_dir)
+    from rich.text import Text
+
+    mgr = CheckpointManager(cp_dir, background=True)
     ig = InteractiveGrove(
         tree, runner,
         checkpoint_mgr=mgr,
         on_agent_start=ui.on_agent_start,
         on_agent_done=ui.on_agent_done,
         on_propagate=ui.on_propagate,
+        max_workers=max_workers,
     )
     levels = ig.setup(task)
-    ui.console.print(f"[dim]Tree has {len(levels)} levels to process.[/dim]\n")
+    ui.print(f"[dim]Tree has {len(levels)} levels to process.[/dim]\n")
+
+    # Parsed once; reprinted before every command prompt
+    commands_help = Text.from_markup(
+        "[bold]Commands:[/bold] [dim](n)ext step | (c)heckpoint | (i)nspect <id> | "
+        "(e)dit <id> <topic> <value> | (r)ollback <cp_id> | (q)uit[/dim]"
+    )
 
     while True:
         try:
@@ -49,79 +57,81 @@ def _run_step_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str)
             break
 
         ui.print_step_result(step)
-        ui.console.print()
+        ui.print()
 
         if step.is_complete:
             break
 
         # Interactive prompt between levels
         while True:
-            ui.console.print("[bold]Commands:[/bold] [dim](n)ext step | (c)heckpoint | (i)nspect <id> | (e)dit <id> <topic> <value> | (r)ollback <cp_id> | (q)uit[/dim]")
+            ui.print(commands_help)
             try:
                 cmd = input("> ").strip()
             except (EOFError, KeyboardInterrupt):
-                ui.console.print("\n[dim]Interrupted[/dim]")
+                ui.print("\n[dim]Interrupted[/dim]")
                 return
 
+            verb, _, arg = cmd.partition(" ")
+            arg = arg.strip()
             if not cmd or cmd in ("n", "next"):
                 break
             elif cmd in ("c", "checkpoint"):
                 cp_id = ig.checkpoint()
                 ui.print_checkpoint(cp_id)
-            elif cmd.startswith(("i ", "inspect ")):
-                parts = cmd.split(maxsplit=1)
-                if len(parts) == 2:
-                    try:
-                        facts = ig.inspect_node(parts[1])
-                        ui.print_node_facts(parts[1], facts)
-                    except KeyError as e:
-                        ui.console.print(f"  [red]{e}[/red]")
-            elif cmd.startswith(("e ", "edit ")):
-                parts = cmd.split(maxsplit=3)
-                if len(parts) == 4:
+            elif verb in ("i", "inspect") and arg:
+                try:
+                    facts = ig.inspect_node(arg)
+                    ui.print_node_facts(arg, facts)
+                except KeyError as e:
+                    ui.print(f"  [red]{e}[/red]")
+            elif verb in ("e", "edit") and arg:
+                parts = arg.split(maxsplit=2)
+                if len(parts) == 3:
                     try:
-                        ig.edit_fact(parts[1], parts[2], parts[3])
-                        ui.console.print(f"  [green]Set {parts[2]} on {parts[1]}[/green]")
+                        ig.edit_fact(parts[0], parts[1], parts[2])
+                        ui.print(f"  [green]Set {parts[1]} on {parts[0]}[/green]")
                     except KeyError as e:
-                        ui.console.print(f"  [red]{e}[/red]")
+                        ui.print(f"  [red]{e}[/red]")
                 else:
-                    ui.console.print("  [red]Usage: edit <agent_id> <topic> <value>[/red]")
-            elif cmd.startswith(("r ", "rollback ")):
-                parts = cmd.split(maxsplit=1)
-                if len(parts) == 2:
-                    try:
-                        ig.rollback(parts[1])
-                        ui.print_rollback(parts[1])
-                    except FileNotFoundError as e:
-                        ui.console.print(f"  [red]{e}[/red]")
+                    ui.print("  [red]Usage: edit <agent_id> <topic> <value>[/red]")
+            elif verb in ("r", "rollback") and arg:
+                try:
+                    ig.rollback(arg)
+                    ui.print_rollback(arg)
+                except FileNotFoundError as e:
+                    ui.print(f"  [red]{e}[/red]")
             elif cmd in ("q", "quit"):
                 return
             else:
-                ui.console.print("  [dim]Unknown command[/dim]")
+                ui.print("  [dim]Unknown command[/dim]")
 
     result = ig.result()
     ui.print_result(result)
     return result
 
 
-def _run_chat_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str) -> None:
+def _run_chat_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str, max_workers: int = 1) -> None:
     """Run grove then enter chat loop with root agent."""
-    mgr = CheckpointManager(cp_dir)
+    from rich import box
+    from rich.panel import Panel
+
+    mgr = CheckpointManager(cp_dir, background=True)
 
     # First do a full grove execution
-    ui.console.print("[bold]Phase 1: Running grove...[/bold]\n")
+    ui.print("[bold]Phase 1: Running grove...[/bold]\n")
     grove = Grove(
         tree, runner,
         on_agent_start=ui.on_agent_start,
         on_agent_done=ui.on_agent_done,
         on_propagate=ui.on_propagate,
+        max_workers=max_workers,
     )
     result = grove.execute(task)
     ui.print_result(result)
 
     # Enter chat mode
-    ui.console.print()
-    ui.console.print(
+    ui.print()
+    ui.print(
         Panel(
             "Chat with the root agent to refine results.\n"
             "Commands: [bold]checkpoint[/bold], [bold]rollback <id>[/bold], [bold]quit[/bold]",
@@ -137,7 +147,7 @@ def _run_chat_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str)
         try:
             user_input = input("\n[You] > ").strip()
         except (EOFError, KeyboardInterrupt):
-            ui.console.print("\n[dim]Goodbye[/dim]")
+            ui.print("\n[dim]Goodbye[/dim]")
             return
 
         if not user_input:
@@ -154,7 +164,7 @@ def _run_chat_mode(tree: TreeEngine, runner, ui: TreeUI, task: str, cp_dir: str)
                 session.rollback(cp_id)
                 ui.print_rollback(cp_id)
             except FileNotFoundError as e:
-                ui.console.print(f"  [red]{e}[/red]")
+                ui.print(f"  [red]{e}[/red]")
             continue
 
         resp = session.chat(user_input)
@@ -173,14 +183,22 @@ def main() -> None:
     parser.add_argument("--no-api", action="store_true", help="Echo mode")
     parser.add_argument("--checkpoint-dir", default=None,
                         help="Directory for checkpoints (default: temp dir)")
+    parser.add_argument("--parallel", action="store_true", help="Run sibling agents concurrently")
+    parser.add_argument("--response-cache", action="store_true",
+                        help="Reuse LLM replies for repeated requests (stored under <checkpoint-dir>/plan_cache)")
     args = parser.parse_args()
 
+    # rich is imported only once we get past argument parsing
+    from tree_ui import TreeUI
+
     ui = TreeUI()
     ui.print_header()
 
     tree = build_grove_tree()
     ui.print_tree(tree)
 
+    cp_dir = args.checkpoint_dir or tempfile.mkdtemp(prefix="sag_checkpoints_")
+
     # Set up runner
     runner = None
     if not args.no_api:
@@ -194,26 +212,28 @@ def main() -> None:
             else:
                 from claude_client import ClaudeClient
                 client = ClaudeClient(api_key=api_key, model=model)
-            ui.console.print(f"[dim]Using {args.provider} model: {model}[/dim]\n")
+            ui.print(f"[dim]Using {args.provider} model: {model}[/dim]\n")
+            if args.response_cache:
+                client = CachedClient(client, ResponseCache(os.path.join(cp_dir, "plan_cache")))
             runner = LLMAgentRunner(client)
         else:
-            ui.console.print(f"[yellow]No API key found. Running in echo mode.[/yellow]")
-            ui.console.print(f"[dim]Set {env_key} or use --api-key.[/dim]\n")
+            ui.print(f"[yellow]No API key found. Running in echo mode.[/yellow]")
+            ui.print(f"[dim]Set {env_key} or use --api-key.[/dim]\n")
 
     if runner is None:
         runner = EchoAgentRunner()
         if args.no_api:
-            ui.console.print("[dim]Running in echo mode (--no-api)[/dim]\n")
+            ui.print("[dim]Running in echo mode (--no-api)[/dim]\n")
 
     ui.print_task(args.task)
 
-    cp_dir = args.checkpoint_dir or tempfile.mkdtemp(prefix="sag_checkpoints_")
-    ui.console.print(f"[dim]Checkpoints: {cp_dir}[/dim]\n")
+    ui.print(f"[dim]Checkpoints: {cp_dir}[/dim]\n")
 
+    max_workers = PARALLEL_WORKERS if args.parallel else 1
     if args.mode == "step":
-        _run_step_mode(tree, runner, ui, args.task, cp_dir)
+        _run_step_mode(tree, runner, ui, args.task, cp_dir, max_workers)
     else:
-        _run_chat_mode(tree, runner, ui, args.task, cp_dir)
+        _run_chat_mode(tree, runner, ui, args.task, cp_dir, max_workers)
 
     ui.print_goodbye()
 
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-import sys
-import os
-from dataclasses import dataclass, field
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
+from collections import deque
+from dataclasses import dataclass
 
 from sag.minifier import MessageMinifier
 from sag.model import Message
 
 
-@dataclass
+# Fold event descriptions kept for metrics; older ones are dropped
+MAX_FOLD_EVENTS = 1024
+
+
+@dataclass(slots=True)
 class MemoryMetrics:
     raw_tokens: int = 0
     actual_tokens: int = 0
@@ -20,7 +21,7 @@ class MemoryMetrics:
     active_folds: int = 0
     tree_depth: int = 0
     total_messages: int = 0
-    fold_events: list[str] = field(default_factory=list)
+    fold_events: tuple[str, ...] = ()
 
 
 class MemoryMonitor:
@@ -31,7 +32,7 @@ class MemoryMonitor:
         self._actual_tokens = 0
         self._active_folds = 0
         self._total_messages = 0
-        self._fold_events: list[str] = []
+        self._fold_events: deque[str] = deque(maxlen=MAX_FOLD_EVENTS)
 
     def record_message(self, message: Message) -> None:
         tokens = MessageMinifier.count_tokens(MessageMinifier.to_minified_string(message))
@@ -57,7 +58,7 @@ class MemoryMonitor:
             active_folds=self._active_folds,
             tree_depth=0,
             total_messages=self._total_messages,
-            fold_events=list(self._fold_events),
+            fold_events=tuple(self._fold_events),
         )
 
     @property
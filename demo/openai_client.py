@@ -3,31 +3,41 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from functools import cached_property
+
+try:
+    import openai
+except ImportError:
+    openai = None
 
 
 class OpenAIClient:
     def __init__(self, api_key: str | None = None, model: str = "gpt-4o"):
         self._api_key = api_key or os.environ.get("OPENAI_API_KEY", "")
         self._model = model
-        self._client = None
 
-    def _ensure_client(self):
-        if self._client is None:
-            try:
-                import openai
-                self._client = openai.OpenAI(api_key=self._api_key)
-            except ImportError:
-                raise RuntimeError("openai package not installed. Run: pip install openai")
+    @cached_property
+    def _client(self):
+        if openai is None:
+            raise RuntimeError("openai package not installed. Run: pip install openai")
+        return openai.OpenAI(api_key=self._api_key)
 
     def complete(self, system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> str:
-        self._ensure_client()
-        full_messages = [{"role": "system", "content": system_prompt}] + messages
-        response = self._client.chat.completions.create(
+        return "".join(self.complete_stream(system_prompt, messages, max_tokens))
+
+    def complete_stream(self, system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
+        """Yield the response text as it is generated."""
+        full_messages = [{"role": "system", "content": system_prompt}, *messages]
+        stream = self._client.chat.completions.create(
             model=self._model,
             max_tokens=max_tokens,
             messages=full_messages,
+            stream=True,
         )
-        return response.choices[0].message.content
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
     @property
     def model(self) -> str:
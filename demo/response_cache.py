@@ -0,0 +1,125 @@
+"""On-disk cache of LLM completions keyed by the full request."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class ResponseCache:
+    """Completion text stored one file per request fingerprint.
+
+    Entries older than ``ttl`` seconds are ignored and removed on lookup.
+    After each write the oldest entries are evicted until the cache fits in
+    ``max_bytes``. Writes go through a temp file and ``os.replace`` so a
+    reader never sees a partial entry.
+    """
+
+    def __init__(self, directory: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._dir = directory
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(model: str, system_prompt: str, messages: list[dict], max_tokens: int) -> str:
+        payload = json.dumps([model, system_prompt, messages, max_tokens], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self._ttl:
+                os.remove(path)
+                return None
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._evict()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, f"{key}.txt")
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self._dir) as it:
+            for entry in it:
+                if entry.name.endswith(".txt"):
+                    try:
+                        st = entry.stat()
+                    except OSError:  # removed by a concurrent eviction
+                        continue
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= self._max_bytes:
+            return
+        entries.sort()
+        for _mtime, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self._max_bytes:
+                break
+
+
+class CachedClient:
+    """Wraps a Claude/OpenAI client, answering repeated requests from a ResponseCache."""
+
+    def __init__(self, client, cache: ResponseCache):
+        self._client = client
+        self._cache = cache
+
+    def complete(self, system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        key = self._key(system_prompt, messages, max_tokens)
+        text = self._cache.get(key)
+        if text is None:
+            text = self._client.complete(system_prompt, messages, max_tokens)
+            self._cache.put(key, text)
+        return text
+
+    def complete_stream(self, system_prompt: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
+        """Yield the response text; a cache hit arrives as a single chunk."""
+        key = self._key(system_prompt, messages, max_tokens)
+        text = self._cache.get(key)
+        if text is not None:
+            yield text
+            return
+        if not hasattr(self._client, "complete_stream"):
+            text = self._client.complete(system_prompt, messages, max_tokens)
+            self._cache.put(key, text)
+            yield text
+            return
+        chunks: list[str] = []
+        for chunk in self._client.complete_stream(system_prompt, messages, max_tokens):
+            chunks.append(chunk)
+            yield chunk
+        # Only a completed stream is cached
+        self._cache.put(key, "".join(chunks))
+
+    def _key(self, system_prompt: str, messages: list[dict], max_tokens: int) -> str:
+        return ResponseCache.fingerprint(self.model, system_prompt, messages, max_tokens)
+
+    @property
+    def model(self) -> str:
+        return getattr(self._client, "model", "")
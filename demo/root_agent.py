@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import os
-import sys
+import json
+import secrets
 import time
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from itertools import islice
 
 from sag.parser import SAGMessageParser
 from sag.minifier import MessageMinifier
@@ -18,6 +19,9 @@ from sag.prompt import PromptBuilder
 from memory import MemoryMonitor
 from fold_agent import FoldAgent
 
+# Facts carried into the system prompt; the least recently updated are dropped
+MAX_FACTS = 64
+
 
 class RootAgent:
     def __init__(
@@ -30,9 +34,12 @@ class RootAgent:
         self._correlation = CorrelationEngine("root")
         self._memory = MemoryMonitor(budget=budget, threshold=threshold)
         self._fold_agent = FoldAgent(claude_client)
-        self._history: list[Message] = []
+        self._history: deque[Message] = deque()
         self._raw_history: list[str] = []
-        self._accumulated_state: dict = {}
+        self._accumulated_state: OrderedDict[str, object] = OrderedDict()
+        # Serialized facts for the system prompt, rebuilt only after a fold adds facts
+        self._facts_json: str | None = None
+        self._facts_dirty = True
         self._system_prompt = (
             PromptBuilder()
             .set_preamble(
@@ -56,14 +63,19 @@ class RootAgent:
             .build()
         )
 
-    def process_input(self, user_text: str) -> tuple[str, list[str]]:
-        """Process user input, return (response_text, fold_events)."""
-        fold_events: list[str] = []
+    def process_input(
+        self, user_text: str, on_chunk: Callable[[str], None] | None = None
+    ) -> tuple[str, list[str]]:
+        """Process user input, return (response_text, fold_events).
 
-        # Create user message in SAG format
+        If ``on_chunk`` is given and the client can stream, it is called with
+        each piece of the response as it arrives.
+        """
+        # Create user message in SAG format; a random id cannot collide the
+        # way a clock-derived one can for inputs in quick succession
         user_header = Header(
             version=1,
-            message_id=f"user-{int(time.time())}",
+            message_id=f"user-{secrets.token_hex(8)}",
             source="user",
             destination="root",
             timestamp=int(time.time()),
@@ -76,11 +88,10 @@ class RootAgent:
         self._memory.record_message(user_msg)
 
         # Check memory pressure and fold if needed
-        if self._memory.should_fold() and len(self._history) > 4:
-            fold_events.extend(self._do_fold())
+        fold_events = self.fold_if_needed()
 
         # Generate response
-        response_text = self._generate_response(user_text)
+        response_text = self._generate_response(user_text, on_chunk)
 
         # Parse or wrap response as SAG
         response_msg = self._parse_or_wrap_response(response_text)
@@ -89,6 +100,12 @@ class RootAgent:
 
         return response_text, fold_events
 
+    def fold_if_needed(self) -> list[str]:
+        """Fold older messages if memory is under pressure, return fold_events."""
+        if self._memory.should_fold() and len(self._history) > 4:
+            return self._do_fold()
+        return []
+
     def process_recall(self, fold_id: str) -> str | None:
         """Recall a folded conversation segment."""
         messages = self._fold_agent.unfold(fold_id)
@@ -105,39 +122,50 @@ class RootAgent:
         events = []
 
         # Fold all but the last 4 messages
-        to_fold = self._history[:-4]
-        if len(to_fold) < 2:
+        n_fold = len(self._history) - 4
+        if n_fold < 2:
             return events
+        to_fold = list(islice(self._history, n_fold))
 
         fold_id, original_tokens, fold_tokens, facts = self._fold_agent.fold(to_fold)
         self._memory.record_fold(original_tokens, fold_tokens, f"fold:{fold_id}")
 
         # Accumulate extracted facts across folds
         if facts:
-            self._accumulated_state.update(facts)
+            state = self._accumulated_state
+            for key, value in facts.items():
+                state[key] = value
+                state.move_to_end(key)
+            while len(state) > MAX_FACTS:
+                state.popitem(last=False)
+            self._facts_dirty = True
 
         event = f"Folded {len(to_fold)} messages into {fold_id} (saved {original_tokens - fold_tokens} tokens)"
         events.append(event)
 
-        # Replace folded messages with a fold reference
-        self._history = self._history[-4:]
+        # Drop the folded messages, keeping the last 4
+        for _ in range(n_fold):
+            self._history.popleft()
 
         return events
 
-    def _generate_response(self, user_text: str) -> str:
+    def _generate_response(self, user_text: str, on_chunk: Callable[[str], None] | None = None) -> str:
         """Generate response using Claude or fallback."""
         # Build system prompt with accumulated facts
         system_prompt = self._system_prompt
         if self._accumulated_state:
-            import json
-            facts_str = json.dumps(self._accumulated_state, indent=2)
-            system_prompt += f"\n\n[Known facts]\nThese facts were established earlier in the conversation and should be referenced when relevant:\n{facts_str}"
+            if self._facts_dirty:
+                self._facts_json = json.dumps(self._accumulated_state, indent=2)
+                self._facts_dirty = False
+            system_prompt += f"\n\n[Known facts]\nThese facts were established earlier in the conversation and should be referenced when relevant:\n{self._facts_json}"
 
         if self._client:
+            chunks: list[str] = []
             try:
                 # Build conversation context from recent history
                 messages = []
-                for msg in self._history[-10:]:  # Last 10 messages for context
+                start = max(0, len(self._history) - 10)
+                for msg in islice(self._history, start, None):  # Last 10 messages for context
                     minified = MessageMinifier.to_minified_string(msg)
                     role = "user" if msg.header.source == "user" else "assistant"
                     messages.append({"role": role, "content": minified})
@@ -146,6 +174,12 @@ class RootAgent:
                 if not messages or messages[-1]["role"] != "user":
                     messages.append({"role": "user", "content": user_text})
 
+                if on_chunk is not None and hasattr(self._client, "complete_stream"):
+                    for chunk in self._client.complete_stream(system_prompt, messages, max_tokens=512):
+                        chunks.append(chunk)
+                        on_chunk(chunk)
+                    return "".join(chunks)
+
                 result = self._client.complete(
                     system_prompt,
                     messages,
@@ -153,7 +187,11 @@ class RootAgent:
                 )
                 return result
             except Exception as e:
-                return f'A response = "I encountered an error: {e}"'
+                error = f'A response = "I encountered an error: {e}"'
+                if chunks:
+                    # Part of the reply is already on screen; append the error to it
+                    on_chunk(f"\n{error}")
+                return error
 
         # Fallback response
         return f'A response = "Echo: {user_text}"'
@@ -167,21 +205,13 @@ class RootAgent:
         except SAGParseException:
             pass
 
-        # Wrap as a SAG message with assert
+        # Wrap as a SAG message with assert; built directly, as we already
+        # hold the header and the exact value a parse would yield
         header = self._correlation.create_response_header("root", "user")
-        safe_text = response_text.replace('"', '\\"').replace("\n", "\\n")
-        msg_text = (
-            f"H v 1 id={header.message_id} src=root dst=user ts={header.timestamp}\n"
-            f'A response = "{safe_text}"'
+        return Message(
+            header=header,
+            statements=[AssertStatement(path="response", value=response_text)],
         )
-        try:
-            return SAGMessageParser.parse(msg_text)
-        except SAGParseException:
-            # Last resort: minimal message
-            return Message(
-                header=header,
-                statements=[AssertStatement(path="response", value=response_text)],
-            )
 
     @property
     def memory(self) -> MemoryMonitor:
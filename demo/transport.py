@@ -3,12 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import sys
-import os
 from typing import Callable, Optional
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
-
 from sag.parser import SAGMessageParser
 from sag.minifier import MessageMinifier
 from sag.model import Message
@@ -50,13 +46,29 @@ class WebSocketTransport:
         self._server = await websockets.serve(handler, self._host, self._port)
 
     async def send(self, message: Message):
-        raw = MessageMinifier.to_minified_string(message)
-        for ws in self._connections:
-            await ws.send(raw)
+        await self.send_raw(MessageMinifier.to_minified_string(message))
 
     async def send_raw(self, raw: str):
-        for ws in self._connections:
-            await ws.send(raw)
+        """Send ``raw`` to every connected client concurrently.
+
+        Clients whose connection has closed are dropped; any other send
+        error is re-raised once all sends have finished.
+        """
+        from websockets.exceptions import ConnectionClosed
+
+        # Snapshot: the handler may add or discard connections while we await
+        snapshot = tuple(self._connections)
+        results = await asyncio.gather(
+            *(ws.send(raw) for ws in snapshot), return_exceptions=True
+        )
+        error = None
+        for ws, result in zip(snapshot, results):
+            if isinstance(result, ConnectionClosed):
+                self._connections.discard(ws)
+            elif isinstance(result, BaseException) and error is None:
+                error = result
+        if error is not None:
+            raise error
 
     async def stop(self):
         if self._server:
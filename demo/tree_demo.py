@@ -5,13 +5,10 @@ from __future__ import annotations
 
 import argparse
 import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
 
+import _bootstrap  # noqa: F401
 from sag.tree import TreeEngine
 from sag.grove import EchoAgentRunner, Grove, LLMAgentRunner
-from tree_ui import TreeUI
 
 # ---------------------------------------------------------------------------
 # Software dev grove configuration
@@ -119,6 +116,9 @@ ENV_KEY_NAMES = {
     "openai": "OPENAI_API_KEY",
 }
 
+# Worker threads for --parallel; enough for the widest level of the demo tree
+PARALLEL_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Main
@@ -133,8 +133,12 @@ def main() -> None:
     parser.add_argument("--api-key", help="API key (or set ANTHROPIC_API_KEY / OPENAI_API_KEY)")
     parser.add_argument("--model", default=None, help="Model to use")
     parser.add_argument("--no-api", action="store_true", help="Run without LLM API (echo mode)")
+    parser.add_argument("--parallel", action="store_true", help="Run sibling agents concurrently")
     args = parser.parse_args()
 
+    # rich is imported only once we get past argument parsing
+    from tree_ui import TreeUI
+
     ui = TreeUI()
     ui.print_header()
 
@@ -155,18 +159,18 @@ def main() -> None:
             else:
                 from claude_client import ClaudeClient
                 client = ClaudeClient(api_key=api_key, model=model)
-            ui.console.print(f"[dim]Using {args.provider} model: {model}[/dim]\n")
+            ui.print(f"[dim]Using {args.provider} model: {model}[/dim]\n")
             runner = LLMAgentRunner(client)
         else:
-            ui.console.print(f"[yellow]No API key found. Running in echo mode.[/yellow]")
-            ui.console.print(f"[dim]Set {env_key} or use --api-key to enable {args.provider}.[/dim]\n")
+            ui.print(f"[yellow]No API key found. Running in echo mode.[/yellow]")
+            ui.print(f"[dim]Set {env_key} or use --api-key to enable {args.provider}.[/dim]\n")
 
     if runner is None:
         runner = EchoAgentRunner()
         if not args.no_api:
             pass  # already printed warning
         else:
-            ui.console.print("[dim]Running in echo mode (--no-api)[/dim]\n")
+            ui.print("[dim]Running in echo mode (--no-api)[/dim]\n")
 
     # Show task
     ui.print_task(args.task)
@@ -178,6 +182,7 @@ def main() -> None:
         on_agent_start=ui.on_agent_start,
         on_agent_done=ui.on_agent_done,
         on_propagate=ui.on_propagate,
+        max_workers=PARALLEL_WORKERS if args.parallel else 1,
     )
 
     result = grove.execute(args.task)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python-sag", "src"))
+import threading
+import time
+from functools import lru_cache
+from typing import Any
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich.tree import Tree
 from rich import box
 
@@ -19,15 +20,89 @@ from sag.minifier import MessageMinifier
 from sag.grove import ChatResponse, GroveResult, StepResult
 
 
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+@lru_cache(maxsize=1024)
+def _node_label(role: str, agent_id: str) -> str:
+    return f"[bold]{role}[/bold] [dim]({agent_id})[/dim]"
+
+
+@lru_cache(maxsize=1024)
+def _start_line(role: str, agent_id: str, is_leaf: bool, is_root: bool) -> str:
+    icon = "\u2192" if is_leaf else "\u25b6"
+    level = "leaf" if is_leaf else ("root" if is_root else "lead")
+    return f"  {icon} [bold cyan]{role}[/bold cyan] [dim]({agent_id})[/dim] [{level}] ..."
+
+
 class TreeUI:
-    """Rich TUI that observes grove execution via callbacks."""
+    """Rich TUI that observes grove execution via callbacks.
+
+    The per-agent progress callbacks only render when the console is a
+    terminal or notebook. When output is redirected they return at once;
+    the tree, task and results are still printed. Set ``FORCE_COLOR`` to
+    keep progress in piped output.
+
+    Progress output is coalesced: callbacks queue their lines and the queue
+    is written in one pass at most ~30 times a second (or once 16 lines are
+    waiting), with a timer making sure nothing waits longer than a frame.
+    """
+
+    FLUSH_INTERVAL = 1 / 30
+    FLUSH_LINES = 16
 
     def __init__(self, console: Console | None = None) -> None:
         self.console = console or Console()
+        self._live = self.console.is_terminal or self.console.is_jupyter
+        self._pending: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        # Held across taking the queue and writing it, so a timer flush and
+        # a main-thread flush cannot write their batches out of order
+        self._print_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._last_flush = 0.0
+        # Agent whose start line is still open, waiting for " done" on the
+        # same line; with parallel levels other agents start in between
+        self._open_agent: str | None = None
+
+    def flush(self) -> None:
+        """Write any queued progress output now."""
+        with self._print_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                pending, self._pending = self._pending, []
+                self._last_flush = time.monotonic()
+            if pending:
+                with self.console:  # buffers the prints into a single write
+                    for args, kwargs in pending:
+                        self.console.print(*args, **kwargs)
+
+    def _emit(self, *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self._pending.append((args, kwargs))
+            due = (
+                len(self._pending) >= self.FLUSH_LINES
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+            )
+            if not due and self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            self.flush()
+
+    def print(self, *args: Any, **kwargs: Any) -> None:
+        """Print now, after any queued progress output (as every print_* does)."""
+        self.flush()
+        self.console.print(*args, **kwargs)
 
     # -- Static displays --
 
     def print_header(self) -> None:
+        self.flush()
         self.console.print()
         self.console.print(
             Panel(
@@ -41,42 +116,64 @@ class TreeUI:
         self.console.print()
 
     def print_tree(self, tree: TreeEngine) -> None:
+        self.flush()
         root = tree.get_root()
-        rich_tree = Tree(f"[bold]{root.role}[/bold] [dim]({root.agent_id})[/dim]")
+        rich_tree = Tree(_node_label(root.role, root.agent_id))
         self._build_rich_tree(root, rich_tree)
         self.console.print(Panel(rich_tree, title="[bold]Agent Tree[/bold]", box=box.ROUNDED))
         self.console.print()
 
     def print_task(self, task: str) -> None:
+        self.flush()
         self.console.print(Panel(task, title="[bold green]Task[/bold green]", box=box.ROUNDED, style="green"))
         self.console.print()
 
     # -- Callbacks for Grove --
 
     def on_agent_start(self, node: AgentNode, task: str) -> None:
-        icon = "\u2192" if node.is_leaf else "\u25b6"
-        level = "leaf" if node.is_leaf else ("root" if node.is_root else "lead")
-        self.console.print(f"  {icon} [bold cyan]{node.role}[/bold cyan] [dim]({node.agent_id})[/dim] [{level}] ...", end="")
+        if not self._live:
+            return
+        if self._open_agent is not None:
+            self._emit("")  # end the previous agent's start line
+        self._emit(_start_line(node.role, node.agent_id, node.is_leaf, node.is_root), end="")
+        self._open_agent = node.agent_id
 
     def on_agent_done(self, node: AgentNode, facts: dict[str, str]) -> None:
-        self.console.print(f" [bold green]done[/bold green] ({len(facts)} facts)")
+        if not self._live:
+            return
+        if self._open_agent == node.agent_id:
+            self._emit(f" [bold green]done[/bold green] ({len(facts)} facts)")
+        else:
+            if self._open_agent is not None:
+                self._emit("")
+            self._emit(
+                f"  \u2713 [bold cyan]{node.role}[/bold cyan] [dim]({node.agent_id})[/dim] "
+                f"[bold green]done[/bold green] ({len(facts)} facts)"
+            )
+        self._open_agent = None
         for topic, value in facts.items():
-            display = value if len(value) <= 80 else value[:77] + "..."
-            self.console.print(f"      [dim]{topic}[/dim] = [italic]{display}[/italic]")
+            self._emit(f"      [dim]{topic}[/dim] = [italic]{_truncate(value, 80)}[/italic]")
 
     def on_propagate(self, child: AgentNode, parent: AgentNode, msg: Message) -> None:
+        if not self._live:
+            return
         n_stmts = len(msg.statements)
-        self.console.print(
+        # One print for the summary line plus the whole wire message; the wire
+        # text is plain Text so SAG brackets are never read as markup
+        out = Text.from_markup(
             f"      [yellow]\u2191[/yellow] {n_stmts} facts: "
             f"[dim]{child.agent_id}[/dim] \u2192 [dim]{parent.agent_id}[/dim]"
         )
         wire = MessageMinifier.to_minified_string(msg)
         for line in wire.split("\n"):
-            self.console.print(f"        [dim]{line}[/dim]")
+            out.append("\n        ")
+            out.append(line, style="dim")
+        self._emit(out)
 
     # -- Results --
 
     def print_result(self, result: GroveResult) -> None:
+        self.flush()
         self.console.print()
         self.console.print(
             Panel(
@@ -96,19 +193,18 @@ class TreeUI:
             table.add_column("Value", style="white")
 
             for topic, (value, _ver) in sorted(result.facts.items()):
-                display = str(value)
-                if len(display) > 100:
-                    display = display[:97] + "..."
-                table.add_row(topic, display)
+                table.add_row(topic, _truncate(str(value), 100))
 
             self.console.print(Panel(table, title="[bold]Root Knowledge[/bold]", box=box.ROUNDED))
 
     def print_goodbye(self) -> None:
+        self.flush()
         self.console.print("\n[bold blue]Done![/bold blue]")
 
     # -- Interactive grove displays --
 
     def print_step_result(self, step: StepResult) -> None:
+        self.flush()
         status = "[bold green]COMPLETE[/bold green]" if step.is_complete else "[bold yellow]IN PROGRESS[/bold yellow]"
         self.console.print(
             Panel(
@@ -121,43 +217,45 @@ class TreeUI:
         if step.facts_produced:
             for agent_id, facts in step.facts_produced.items():
                 for topic, value in facts.items():
-                    display = value if len(value) <= 80 else value[:77] + "..."
-                    self.console.print(f"    [dim]{agent_id}[/dim] {topic} = [italic]{display}[/italic]")
+                    self.console.print(f"    [dim]{agent_id}[/dim] {topic} = [italic]{_truncate(value, 80)}[/italic]")
 
     def print_checkpoint(self, checkpoint_id: str) -> None:
+        self.flush()
         self.console.print(f"  [green]Checkpoint saved:[/green] [dim]{checkpoint_id}[/dim]")
 
     def print_rollback(self, checkpoint_id: str) -> None:
+        self.flush()
         self.console.print(f"  [yellow]Rolled back to:[/yellow] [dim]{checkpoint_id}[/dim]")
 
     def print_chat_response(self, resp: ChatResponse) -> None:
+        self.flush()
         self.console.print()
         if resp.facts_updated:
             table = Table(box=box.SIMPLE, show_header=True, padding=(0, 1))
             table.add_column("Topic", style="bold cyan")
             table.add_column("Value", style="white")
             for topic, value in resp.facts_updated.items():
-                display = value if len(value) <= 100 else value[:97] + "..."
-                table.add_row(topic, display)
+                table.add_row(topic, _truncate(value, 100))
             self.console.print(Panel(table, title="[bold]Updated Facts[/bold]", box=box.ROUNDED))
         else:
             self.console.print("[dim](no facts updated)[/dim]")
 
     def print_node_facts(self, agent_id: str, facts: dict) -> None:
+        self.flush()
         if not facts:
             self.console.print(f"  [dim]{agent_id}: (no facts)[/dim]")
             return
         self.console.print(f"  [bold cyan]{agent_id}[/bold cyan]:")
         for topic, (value, ver) in sorted(facts.items()):
-            display = str(value)
-            if len(display) > 80:
-                display = display[:77] + "..."
-            self.console.print(f"    {topic} [dim]v{ver}[/dim] = [italic]{display}[/italic]")
+            self.console.print(f"    {topic} [dim]v{ver}[/dim] = [italic]{_truncate(str(value), 80)}[/italic]")
 
     # -- Helpers --
 
     def _build_rich_tree(self, node: AgentNode, rich_node: Tree) -> None:
-        for child in node.children:
-            label = f"[bold]{child.role}[/bold] [dim]({child.agent_id})[/dim]"
-            child_tree = rich_node.add(label)
-            self._build_rich_tree(child, child_tree)
+        # Explicit stack rather than recursion, so deep groves cannot hit the
+        # recursion limit; siblings are still added in order
+        stack = [(node, rich_node)]
+        while stack:
+            node, rich_node = stack.pop()
+            for child in node.children:
+                stack.append((child, rich_node.add(_node_label(child.role, child.agent_id))))
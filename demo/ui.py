@@ -16,6 +16,7 @@ class DemoUI:
     def __init__(self):
         self.console = Console()
         self._events: list[str] = []
+        self._streaming = False
 
     def print_header(self):
         self.console.print()
@@ -37,6 +38,22 @@ class DemoUI:
         self.console.print(f"[bold blue]Agent:[/bold blue] {text}")
         self.console.print()
 
+    def print_agent_chunk(self, chunk: str):
+        """Print part of a streamed agent response."""
+        if not self._streaming:
+            self.console.print("[bold blue]Agent:[/bold blue] ", end="")
+            self._streaming = True
+        self.console.print(chunk, end="", markup=False, highlight=False)
+
+    def end_agent_stream(self) -> bool:
+        """Finish a streamed response; returns False if nothing was streamed."""
+        if not self._streaming:
+            return False
+        self._streaming = False
+        self.console.print()
+        self.console.print()
+        return True
+
     def print_fold_event(self, event: str):
         self.console.print(f"  [bold yellow][FOLD][/bold yellow] {event}")
         self._events.append(event)
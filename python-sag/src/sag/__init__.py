@@ -20,7 +20,7 @@ from sag.expression import ExpressionEvaluator
 from sag.context import Context, MapContext
 from sag.guardrail import GuardrailValidator, ValidationResult
 from sag.minifier import MessageMinifier, TokenComparison
-from sag.correlation import CorrelationEngine
+from sag.correlation import CorrelationEngine, CorrelationIndex
 from sag.schema import (
     ArgType,
     ArgumentSpec,
@@ -65,6 +65,7 @@ __all__ = [
     "MessageMinifier",
     "TokenComparison",
     "CorrelationEngine",
+    "CorrelationIndex",
     "ArgType",
     "ArgumentSpec",
     "VerbSchema",
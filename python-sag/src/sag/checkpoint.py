@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import tempfile
+import threading
 import time
 import uuid
-from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +18,70 @@ from sag.minifier import MessageMinifier
 from sag.model import Message
 from sag.tree import TreeEngine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Set on files written by the stdlib encoder. They may hold ints beyond 64
+# bits, which orjson would read back as floats, so they are decoded the same
+# way they were encoded.
+_STDLIB_MARKER = "json_encoder"
+
+
+def _dumps(data: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # orjson rejects non-str dict keys and ints beyond 64 bits; the
+            # stdlib encodes both, as it does without orjson installed
+            pass
+    data = {**data, _STDLIB_MARKER: "stdlib"}
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes | memoryview) -> dict:
+    # Either encoder writes plain JSON, so files from both (and older indented
+    # checkpoints) load the same way; orjson's decode error subclasses json's
+    if orjson is None:
+        return json.loads(raw)
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # The stdlib writes NaN and Infinity, which orjson refuses to read
+        return json.loads(bytes(raw))
+    if isinstance(data, dict) and data.get(_STDLIB_MARKER) == "stdlib":
+        return json.loads(bytes(raw))
+    return data
+
+
+# Files at least this large are parsed straight from a read-only mapping
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _load_file(path: str | Path) -> dict:
+    with open(path, "rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return _loads(f.read())
+        # orjson reads the mapping in place: no bytes copy of a large file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _loads(view)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    # Write beside the target and rename over it, so a crash mid-write never
+    # leaves a truncated checkpoint (and its whole delta chain) unreadable
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
 
 @dataclass
 class NodeSnapshot:
@@ -37,14 +106,57 @@ class CheckpointMeta:
     total_levels: int
     node_snapshots: dict[str, NodeSnapshot]
     messages: list[str] = field(default_factory=list)
+    # Set on incremental checkpoints, whose file holds only the nodes that
+    # changed since this parent; loading merges the chain back together
+    parent_checkpoint_id: str | None = None
 
 
 class CheckpointManager:
-    """Serializes and restores grove state to/from JSON files on disk."""
+    """Serializes and restores grove state to/from JSON files on disk.
+
+    After the first save, a checkpoint file only stores the nodes that
+    changed since the previous checkpoint saved or restored through this
+    manager, plus a link to it. Every ``full_every``-th checkpoint in a chain
+    is written in full to bound load cost. ``load`` and ``list_checkpoints``
+    always return complete snapshots.
+
+    The most recent ``cache_size`` checkpoints saved or loaded through this
+    manager are also kept in memory, so rolling back to one of them skips
+    reading and decoding its file.
+
+    With ``background=True``, ``save`` hands the encoded file to a writer
+    thread and returns without waiting for the filesystem; at most
+    ``MAX_PENDING_WRITES`` files are queued before ``save`` blocks. Reads and
+    deletes wait for queued writes first, and ``flush`` waits for them
+    explicitly; a failed background write is raised from there. The writer is not a daemon thread, so queued checkpoints are
+    still written when the interpreter exits.
+    """
+
+    MAX_PENDING_WRITES = 16
 
-    def __init__(self, directory: str | Path) -> None:
+    def __init__(
+        self,
+        directory: str | Path,
+        cache_size: int = 8,
+        full_every: int = 10,
+        background: bool = False,
+    ) -> None:
         self._directory = Path(directory)
         self._directory.mkdir(parents=True, exist_ok=True)
+        self._cache_size = cache_size
+        self._full_every = full_every
+        self._recent: OrderedDict[str, CheckpointMeta] = OrderedDict()
+        # Last checkpoint saved or restored: the base for the next delta
+        self._base: CheckpointMeta | None = None
+        # Files in a checkpoint's parent chain, including its own
+        self._chain_len: dict[str, int] = {}
+        self._background = background
+        # Background writes: (checkpoint_id, file bytes) in order, each left
+        # at the front of the queue until it is on disk
+        self._writes = threading.Condition()
+        self._pending: deque[tuple[str, bytes]] = deque()
+        self._writer_thread: threading.Thread | None = None
+        self._write_error: OSError | None = None
 
     def save(
         self,
@@ -55,18 +167,43 @@ class CheckpointManager:
         current_level: int,
         total_levels: int,
     ) -> CheckpointMeta:
-        """Snapshot the entire grove state and write it to disk."""
+        """Snapshot the grove state and write it (or its changes) to disk."""
         checkpoint_id = str(uuid.uuid4())
 
+        node_ids = tree.get_all_node_ids()
+        base = self._base
+        # A delta can only add or replace nodes, so a changed node set
+        # (e.g. a different tree) needs a full checkpoint
+        if base is not None and (
+            self._chain_len.get(base.checkpoint_id, self._full_every) >= self._full_every
+            or set(node_ids) != set(base.node_snapshots)
+            or not (self._is_pending(base.checkpoint_id) or self._path(base.checkpoint_id).exists())
+        ):
+            base = None
+
         node_snapshots: dict[str, NodeSnapshot] = {}
-        for agent_id in tree.get_all_node_ids():
+        changed: dict[str, NodeSnapshot] = {}
+        for agent_id in node_ids:
             node = tree.get_node(agent_id)
-            node_snapshots[agent_id] = NodeSnapshot(
+            prev = base.node_snapshots.get(agent_id) if base is not None else None
+            version = node.knowledge.get_local_version()
+            facts = node.knowledge.get_all_facts()
+            correlation_state = node.correlation.get_state()
+            if (
+                prev is not None
+                and prev.local_version == version
+                and prev.role == node.role
+                and prev.facts == facts
+                and prev.correlation_state == correlation_state
+            ):
+                node_snapshots[agent_id] = prev
+                continue
+            node_snapshots[agent_id] = changed[agent_id] = NodeSnapshot(
                 agent_id=agent_id,
                 role=node.role,
-                facts=node.knowledge.get_all_facts(),
-                local_version=node.knowledge.get_local_version(),
-                correlation_state=node.correlation.get_state(),
+                facts=facts,
+                local_version=version,
+                correlation_state=correlation_state,
             )
 
         wire_messages = [
@@ -82,19 +219,42 @@ class CheckpointManager:
             total_levels=total_levels,
             node_snapshots=node_snapshots,
             messages=wire_messages,
+            parent_checkpoint_id=base.checkpoint_id if base is not None else None,
         )
 
-        path = self._directory / f"{checkpoint_id}.json"
-        path.write_text(json.dumps(_meta_to_dict(meta), indent=2))
-        return meta
+        on_disk = meta if base is None else replace(meta, node_snapshots=changed)
+        self._write(checkpoint_id, _dumps(_meta_to_dict(on_disk)))
+        self._chain_len[checkpoint_id] = 1 if base is None else self._chain_len[base.checkpoint_id] + 1
+        self._base = meta
+        self._remember(meta)
+        return _copy_meta(meta)
 
     def load(self, checkpoint_id: str) -> CheckpointMeta:
-        """Load a checkpoint from disk by ID."""
-        path = self._directory / f"{checkpoint_id}.json"
+        """Load a checkpoint by ID, from memory if recently used, else from disk.
+
+        Returns a copy, so changing it leaves the cache and later deltas intact.
+        """
+        return _copy_meta(self._load(checkpoint_id))
+
+    def _load(self, checkpoint_id: str) -> CheckpointMeta:
+        # The shared, cached object: callers here must not modify it
+        meta = self._recent.get(checkpoint_id)
+        if meta is not None:
+            self._recent.move_to_end(checkpoint_id)
+            return meta
+        self.flush()
+        path = self._path(checkpoint_id)
         if not path.exists():
             raise FileNotFoundError(f"Checkpoint '{checkpoint_id}' not found")
-        data = json.loads(path.read_text())
-        return _dict_to_meta(data)
+        meta = _dict_to_meta(_load_file(path))
+        if meta.parent_checkpoint_id is None:
+            self._chain_len[checkpoint_id] = 1
+        else:
+            parent = self._load(meta.parent_checkpoint_id)
+            meta.node_snapshots = {**parent.node_snapshots, **meta.node_snapshots}
+            self._chain_len[checkpoint_id] = self._chain_len[parent.checkpoint_id] + 1
+        self._remember(meta)
+        return meta
 
     def restore(self, meta: CheckpointMeta, tree: TreeEngine) -> None:
         """Restore a checkpoint's state into a live TreeEngine."""
@@ -109,24 +269,155 @@ class CheckpointManager:
             }
             node.knowledge.load_state(facts, snapshot.local_version)
             node.correlation.load_state(snapshot.correlation_state)
+        # The tree now matches this checkpoint; the next save is a delta on
+        # it. The delta is taken against the stored copy, not the caller's.
+        self._base = None
+        if meta.checkpoint_id in self._chain_len:
+            try:
+                self._base = self._load(meta.checkpoint_id)
+            except FileNotFoundError:
+                pass
 
     def list_checkpoints(self) -> list[CheckpointMeta]:
         """List all checkpoints in the directory, sorted by timestamp."""
-        results: list[CheckpointMeta] = []
-        for path in self._directory.glob("*.json"):
+        self.flush()
+        stored: dict[str, CheckpointMeta] = {}
+        for path in self._stored_files():
             try:
-                data = json.loads(path.read_text())
-                results.append(_dict_to_meta(data))
+                meta = _dict_to_meta(_load_file(path))
             except (json.JSONDecodeError, KeyError):
                 continue
+            stored[meta.checkpoint_id] = meta
+
+        # Resolved checkpoints by id; None for a delta whose chain is broken
+        # (missing parent, or a corrupt chain that cycles)
+        merged: dict[str, CheckpointMeta | None] = {}
+        for checkpoint_id in stored:
+            # Walk up to a resolved or full checkpoint, then merge back down
+            chain: list[CheckpointMeta] = []
+            on_chain: set[str] = set()
+            cur = checkpoint_id
+            while cur is not None and cur not in merged and cur not in on_chain:
+                meta = stored.get(cur)
+                if meta is None:
+                    merged[cur] = None
+                    break
+                on_chain.add(cur)
+                chain.append(meta)
+                cur = meta.parent_checkpoint_id
+            parent = None if cur is None or cur in on_chain else merged[cur]
+            broken = cur is not None and parent is None
+            for meta in reversed(chain):
+                if broken:
+                    merged[meta.checkpoint_id] = None
+                    continue
+                if meta.parent_checkpoint_id is not None:
+                    meta = replace(
+                        meta, node_snapshots={**parent.node_snapshots, **meta.node_snapshots}
+                    )
+                merged[meta.checkpoint_id] = parent = meta
+
+        results = [m for m in map(merged.get, stored) if m is not None]
         results.sort(key=lambda m: m.timestamp)
         return results
 
     def delete(self, checkpoint_id: str) -> None:
-        """Delete a checkpoint file."""
-        path = self._directory / f"{checkpoint_id}.json"
+        """Delete a checkpoint file.
+
+        Incremental checkpoints built on it are first rewritten in full, so
+        they stay loadable.
+        """
+        self.flush()
+        path = self._path(checkpoint_id)
         if path.exists():
+            for child_path in self._stored_files():
+                try:
+                    data = _load_file(child_path)
+                except json.JSONDecodeError:
+                    continue
+                if data.get("parent_checkpoint_id") == checkpoint_id:
+                    child = replace(self._load(data["checkpoint_id"]), parent_checkpoint_id=None)
+                    _write_file(self._path(child.checkpoint_id), _dumps(_meta_to_dict(child)))
+                    self._recent.pop(child.checkpoint_id, None)
+                    self._chain_len.pop(child.checkpoint_id, None)
             path.unlink()
+        self._recent.pop(checkpoint_id, None)
+        self._chain_len.pop(checkpoint_id, None)
+        if self._base is not None and self._base.checkpoint_id == checkpoint_id:
+            self._base = None
+
+    def flush(self) -> None:
+        """Wait until every queued background write is on disk.
+
+        Re-raises the first error a background write hit since the last call.
+        """
+        with self._writes:
+            while self._writer_thread is not None:
+                self._writes.wait()
+            self._raise_write_error()
+
+    def _write(self, checkpoint_id: str, data: bytes) -> None:
+        if not self._background:
+            _write_file(self._path(checkpoint_id), data)
+            return
+        # An earlier write's error is left for flush(): raising it here would
+        # drop this checkpoint, which save() has already recorded in memory
+        with self._writes:
+            while len(self._pending) >= self.MAX_PENDING_WRITES:
+                self._writes.wait()
+            self._pending.append((checkpoint_id, data))
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._drain, name="sag-checkpoint-writer"
+                )
+                self._writer_thread.start()
+
+    def _drain(self) -> None:
+        # Runs until the queue is empty; _write starts a new thread next time
+        while True:
+            with self._writes:
+                if not self._pending:
+                    self._writer_thread = None
+                    self._writes.notify_all()
+                    return
+                checkpoint_id, data = self._pending[0]
+            error = None
+            try:
+                _write_file(self._path(checkpoint_id), data)
+            except OSError as e:
+                error = e
+            with self._writes:
+                self._pending.popleft()
+                if self._write_error is None:
+                    self._write_error = error
+                self._writes.notify_all()
+
+    def _is_pending(self, checkpoint_id: str) -> bool:
+        with self._writes:
+            return any(pending_id == checkpoint_id for pending_id, _ in self._pending)
+
+    def _raise_write_error(self) -> None:
+        # Caller holds self._writes
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _stored_files(self) -> list[str]:
+        # Directory entries already carry the file type, so unlike glob this
+        # needs no stat or Path object per file
+        with os.scandir(self._directory) as it:
+            return [e.path for e in it if e.name.endswith(".json") and e.is_file()]
+
+    def _path(self, checkpoint_id: str) -> Path:
+        return self._directory / f"{checkpoint_id}.json"
+
+    def _remember(self, meta: CheckpointMeta) -> None:
+        if self._cache_size <= 0:
+            return
+        self._recent[meta.checkpoint_id] = meta
+        self._recent.move_to_end(meta.checkpoint_id)
+        while len(self._recent) > self._cache_size:
+            self._recent.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
@@ -134,12 +425,25 @@ class CheckpointManager:
 # ---------------------------------------------------------------------------
 
 
+def _copy_meta(meta: CheckpointMeta) -> CheckpointMeta:
+    """Copy a checkpoint down to its per-node containers."""
+    snapshots = {
+        agent_id: replace(
+            snap, facts=dict(snap.facts), correlation_state=dict(snap.correlation_state)
+        )
+        for agent_id, snap in meta.node_snapshots.items()
+    }
+    return replace(meta, node_snapshots=snapshots, messages=list(meta.messages))
+
+
 def _meta_to_dict(meta: CheckpointMeta) -> dict:
     """Convert CheckpointMeta to a JSON-serializable dict."""
     snapshots = {}
     for agent_id, snap in meta.node_snapshots.items():
-        # Convert tuple values to lists for JSON
-        facts = {k: list(v) for k, v in snap.facts.items()}
+        # Facts are packed flat as [topic, value, version, topic, ...]
+        facts: list[Any] = []
+        for topic, (value, version) in snap.facts.items():
+            facts += (topic, value, version)
         snapshots[agent_id] = {
             "agent_id": snap.agent_id,
             "role": snap.role,
@@ -156,6 +460,7 @@ def _meta_to_dict(meta: CheckpointMeta) -> dict:
         "total_levels": meta.total_levels,
         "node_snapshots": snapshots,
         "messages": meta.messages,
+        "parent_checkpoint_id": meta.parent_checkpoint_id,
     }
 
 
@@ -163,9 +468,12 @@ def _dict_to_meta(data: dict) -> CheckpointMeta:
     """Reconstruct CheckpointMeta from a JSON-parsed dict."""
     snapshots: dict[str, NodeSnapshot] = {}
     for agent_id, snap_data in data["node_snapshots"].items():
-        facts = {
-            k: tuple(v) for k, v in snap_data["facts"].items()
-        }
+        packed = snap_data["facts"]
+        if isinstance(packed, list):
+            facts = dict(zip(packed[::3], zip(packed[1::3], packed[2::3])))
+        else:
+            # Older checkpoints store {topic: [value, version]}
+            facts = {k: tuple(v) for k, v in packed.items()}
         snapshots[agent_id] = NodeSnapshot(
             agent_id=snap_data["agent_id"],
             role=snap_data["role"],
@@ -182,4 +490,5 @@ def _dict_to_meta(data: dict) -> CheckpointMeta:
         total_levels=data["total_levels"],
         node_snapshots=snapshots,
         messages=data.get("messages", []),
+        parent_checkpoint_id=data.get("parent_checkpoint_id"),
     )
@@ -12,6 +12,8 @@ class Context(Protocol):
 
 
 class MapContext:
+    __slots__ = ("_data",)
+
     def __init__(self, data: dict[str, Any] | None = None):
         self._data: dict[str, Any] = dict(data) if data else {}
 
@@ -19,10 +21,11 @@ class MapContext:
         if not path:
             return None
 
-        parts = path.split(".")
-        current: Any = self._data
+        if "." not in path:
+            return self._data.get(path)
 
-        for part in parts:
+        current: Any = self._data
+        for part in path.split("."):
             if isinstance(current, dict):
                 current = current.get(part)
                 if current is None:
@@ -39,11 +42,11 @@ class MapContext:
         if not path:
             return
 
-        parts = path.split(".")
-        if len(parts) == 1:
+        if "." not in path:
             self._data[path] = value
             return
 
+        parts = path.split(".")
         current = self._data
         for part in parts[:-1]:
             nxt = current.get(part)
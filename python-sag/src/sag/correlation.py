@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import itertools
 import time
+from dataclasses import dataclass, field
 from typing import Optional
 
 from sag.model import Header, Message
@@ -9,21 +10,48 @@ from sag.model import Header, Message
 _message_id_counter = itertools.count(1)
 
 
+@dataclass
+class CorrelationIndex:
+    """Lookup tables over a message list, built in one pass.
+
+    Build once with :meth:`build` and pass to ``trace_thread`` /
+    ``find_responses`` when querying the same messages repeatedly.
+    """
+
+    by_id: dict[str, Message] = field(default_factory=dict)
+    by_correlation: dict[str, list[Message]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, messages: list[Message]) -> CorrelationIndex:
+        index = cls()
+        for msg in messages:
+            header = msg.header
+            if header is None:
+                continue
+            if header.message_id is not None:
+                index.by_id[header.message_id] = msg
+            if header.correlation is not None:
+                index.by_correlation.setdefault(header.correlation, []).append(msg)
+        return index
+
+
 class CorrelationEngine:
     def __init__(self, agent_id: str):
         self._agent_id = agent_id
-        self._correlation_map: dict[str, str] = {}
+        self._last_received: Optional[str] = None
+        # Snapshot keys other than last_received, kept only so they round-trip
+        self._extras: Optional[dict[str, str]] = None
 
     def record_incoming(self, message: Message) -> None:
         if message is not None and message.header is not None:
             message_id = message.header.message_id
             if message_id is not None:
-                self._correlation_map["last_received"] = message_id
+                self._last_received = message_id
 
     def create_response_header(self, source: str, destination: str) -> Header:
         message_id = self.generate_message_id()
         timestamp = int(time.time())
-        correlation = self._correlation_map.get("last_received")
+        correlation = self._last_received
         return Header(version=1, message_id=message_id, source=source, destination=destination, timestamp=timestamp, correlation=correlation)
 
     def create_header_with_correlation(self, source: str, destination: str, correlation_id: str) -> Header:
@@ -44,32 +72,43 @@ class CorrelationEngine:
         return f"{self._agent_id}-{counter}"
 
     @staticmethod
-    def trace_thread(messages: list[Message], start_message_id: str) -> list[Message]:
-        message_map: dict[str, Message] = {}
-        for msg in messages:
-            if msg.header is not None and msg.header.message_id is not None:
-                message_map[msg.header.message_id] = msg
+    def trace_thread(
+        messages: list[Message], start_message_id: str, index: Optional[CorrelationIndex] = None
+    ) -> list[Message]:
+        if index is None:
+            index = CorrelationIndex.build(messages)
+        message_map = index.by_id
 
         thread: list[Message] = []
         current_id: Optional[str] = start_message_id
-        visited: set[str] = set()
+        # An acyclic thread visits each indexed message at most once, so a
+        # walk longer than the index has looped; only then are ids tracked
+        limit = len(message_map)
 
-        while current_id is not None and current_id not in visited:
-            visited.add(current_id)
+        while current_id is not None and len(thread) <= limit:
             msg = message_map.get(current_id)
             if msg is None:
                 break
             thread.append(msg)
-            if msg.header.correlation is not None:
-                current_id = msg.header.correlation
-            else:
-                break
+            current_id = msg.header.correlation
+
+        if len(thread) > limit:
+            seen: set[str] = set()
+            for i, msg in enumerate(thread):
+                if msg.header.message_id in seen:
+                    del thread[i:]
+                    break
+                seen.add(msg.header.message_id)
 
         thread.reverse()
         return thread
 
     @staticmethod
-    def find_responses(messages: list[Message], message_id: str) -> list[Message]:
+    def find_responses(
+        messages: list[Message], message_id: str, index: Optional[CorrelationIndex] = None
+    ) -> list[Message]:
+        if index is not None:
+            return list(index.by_correlation.get(message_id, ()))
         responses: list[Message] = []
         for msg in messages:
             if msg.header is not None and msg.header.correlation is not None:
@@ -94,11 +133,17 @@ class CorrelationEngine:
 
     def get_state(self) -> dict[str, str]:
         """Export correlation map for snapshotting."""
-        return dict(self._correlation_map)
+        state = dict(self._extras) if self._extras else {}
+        if self._last_received is not None:
+            state["last_received"] = self._last_received
+        return state
 
     def load_state(self, correlation_map: dict[str, str]) -> None:
         """Restore correlation map from a snapshot."""
-        self._correlation_map = dict(correlation_map)
+        extras = dict(correlation_map)
+        self._last_received = extras.pop("last_received", None)
+        self._extras = extras or None
 
     def clear(self) -> None:
-        self._correlation_map.clear()
+        self._last_received = None
+        self._extras = None
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import operator
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.error.ErrorListener import ErrorListener
@@ -21,6 +23,10 @@ class _ThrowingErrorListener(ErrorListener):
 
 _ThrowingErrorListener.INSTANCE = _ThrowingErrorListener()
 
+# The grammar's WS token is significant in messages but not allowed inside
+# expr, so whitespace is stripped before parsing
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class ExpressionEvaluator:
     @staticmethod
@@ -29,62 +35,112 @@ class ExpressionEvaluator:
             return None
 
         try:
-            clean = re.sub(r"\s+", "", expression)
+            return _compile(expression)(context)
+        except Exception as e:
+            raise SAGParseException(f"Failed to evaluate expression: {e}", cause=e) from e
 
-            input_stream = InputStream(clean)
-            lexer = SAGLexer(input_stream)
-            lexer.removeErrorListeners()
-            lexer.addErrorListener(_ThrowingErrorListener.INSTANCE)
 
-            tokens = CommonTokenStream(lexer)
-            parser = SAGParser(tokens)
-            parser.removeErrorListeners()
-            parser.addErrorListener(_ThrowingErrorListener.INSTANCE)
+_Compiled = Callable[[Context], Any]
+
+
+class _Const:
+    """Compiled literal, or a subexpression folded to one at compile time."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __call__(self, context: Context) -> Any:
+        return self.value
 
-            expr_ctx = parser.expr()
-            return _evaluate_expr(expr_ctx, context)
-        except Exception as e:
-            raise SAGParseException(f"Failed to evaluate expression: {e}", cause=e) from e
 
+_NULL = _Const(None)
 
-def _evaluate_expr(ctx, context: Context) -> Any:
+
+@lru_cache(maxsize=1024)
+def _compile(expression: str) -> _Compiled:
+    # Each distinct expression is parsed and compiled once; evaluation is then
+    # a call per node with the operators and literals already resolved
+    clean = _WHITESPACE_RE.sub("", expression) if _WHITESPACE_RE.search(expression) else expression
+
+    input_stream = InputStream(clean)
+    lexer = SAGLexer(input_stream)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(_ThrowingErrorListener.INSTANCE)
+
+    tokens = CommonTokenStream(lexer)
+    parser = SAGParser(tokens)
+    parser.removeErrorListeners()
+    parser.addErrorListener(_ThrowingErrorListener.INSTANCE)
+
+    return _compile_expr(parser.expr())
+
+
+def _compile_expr(ctx) -> _Compiled:
     if isinstance(ctx, SAGParser.OrExprContext):
-        left = _evaluate_expr(ctx.left, context)
-        right = _evaluate_expr(ctx.right, context)
-        return _to_boolean(left) or _to_boolean(right)
+        left = _compile_expr(ctx.left)
+        right = _compile_expr(ctx.right)
+
+        def evaluate_or(context: Context) -> bool:
+            return _to_boolean(left(context)) or _to_boolean(right(context))
+
+        return _fold(evaluate_or, left, right)
     elif isinstance(ctx, SAGParser.AndExprContext):
-        left = _evaluate_expr(ctx.left, context)
-        right = _evaluate_expr(ctx.right, context)
-        return _to_boolean(left) and _to_boolean(right)
+        left = _compile_expr(ctx.left)
+        right = _compile_expr(ctx.right)
+
+        def evaluate_and(context: Context) -> bool:
+            return _to_boolean(left(context)) and _to_boolean(right(context))
+
+        return _fold(evaluate_and, left, right)
     elif isinstance(ctx, SAGParser.RelExprContext):
-        left = _evaluate_expr(ctx.left, context)
-        right = _evaluate_expr(ctx.right, context)
-        op = ctx.op.text
-        return _evaluate_relational(left, right, op)
-    elif isinstance(ctx, SAGParser.AddExprContext):
-        left = _evaluate_expr(ctx.left, context)
-        right = _evaluate_expr(ctx.right, context)
-        op = ctx.op.text
-        return _evaluate_arithmetic(left, right, op)
-    elif isinstance(ctx, SAGParser.MulExprContext):
-        left = _evaluate_expr(ctx.left, context)
-        right = _evaluate_expr(ctx.right, context)
-        op = ctx.op.text
-        return _evaluate_arithmetic(left, right, op)
+        left = _compile_expr(ctx.left)
+        right = _compile_expr(ctx.right)
+        compare = _RELATIONAL_OPS.get(ctx.op.text, lambda lhs, rhs: False)
+        return _fold(lambda context: compare(left(context), right(context)), left, right)
+    elif isinstance(ctx, (SAGParser.AddExprContext, SAGParser.MulExprContext)):
+        left = _compile_expr(ctx.left)
+        right = _compile_expr(ctx.right)
+        apply = _ARITHMETIC_OPS.get(ctx.op.text, lambda lhs, rhs: 0.0)
+
+        def evaluate_arithmetic(context: Context) -> float:
+            lhs = left(context)
+            rhs = right(context)
+            return apply(_to_double(lhs), _to_double(rhs))
+
+        return _fold(evaluate_arithmetic, left, right)
     elif isinstance(ctx, SAGParser.PrimaryExprContext):
-        return _evaluate_primary(ctx.primary(), context)
-    return None
+        return _compile_primary(ctx.primary())
+    return _NULL
+
+
+def _fold(compiled: _Compiled, left: _Compiled, right: _Compiled) -> _Compiled:
+    """Evaluate an operator node now if both operands are constants."""
+    if isinstance(left, _Const) and isinstance(right, _Const):
+        try:
+            return _Const(compiled(None))
+        except Exception:
+            pass  # e.g. division by zero: leave the error to evaluate()
+    return compiled
 
 
-def _evaluate_primary(ctx: SAGParser.PrimaryContext, context: Context) -> Any:
+def _compile_primary(ctx: SAGParser.PrimaryContext) -> _Compiled:
     if ctx.value() is not None:
-        return _evaluate_value(ctx.value(), context)
+        return _compile_value(ctx.value())
     elif ctx.expr() is not None:
-        return _evaluate_expr(ctx.expr(), context)
-    return None
+        return _compile_expr(ctx.expr())
+    return _NULL
+
 
+def _compile_value(ctx) -> _Compiled:
+    if isinstance(ctx, SAGParser.ValPathContext):
+        path = ctx.path().getText()
+        return lambda context: context.get(path)
+    return _Const(_literal_value(ctx))
 
-def _evaluate_value(ctx, context: Context) -> Any:
+
+def _literal_value(ctx) -> Any:
     if isinstance(ctx, SAGParser.ValStringContext):
         return _unquote(ctx.STRING().getText())
     elif isinstance(ctx, SAGParser.ValIntContext):
@@ -93,45 +149,30 @@ def _evaluate_value(ctx, context: Context) -> Any:
         return float(ctx.FLOAT().getText())
     elif isinstance(ctx, SAGParser.ValBoolContext):
         return ctx.BOOL().getText() == "true"
-    elif isinstance(ctx, SAGParser.ValNullContext):
-        return None
-    elif isinstance(ctx, SAGParser.ValPathContext):
-        path = ctx.path().getText()
-        return context.get(path)
     return None
 
 
-def _evaluate_relational(left: Any, right: Any, op: str) -> bool:
+def _equals(left: Any, right: Any) -> bool:
     if left is None or right is None:
-        if op == "==":
-            return left is right
-        elif op == "!=":
-            return left is not right
-        return False
+        return left is right
+    return _compare_equals(left, right)
+
+
+def _not_equals(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return left is not right
+    return not _compare_equals(left, right)
+
 
-    if op == "==":
-        return _compare_equals(left, right)
-    elif op == "!=":
-        return not _compare_equals(left, right)
-    elif op in (">", "<", ">=", "<="):
+def _numeric_comparison(op: str, compare: Callable[[float, float], bool]) -> Callable[[Any, Any], bool]:
+    def evaluate(left: Any, right: Any) -> bool:
+        if left is None or right is None:
+            return False
         if not (isinstance(left, (int, float)) and isinstance(right, (int, float))):
             raise ValueError(f"Cannot compare non-numeric values with {op}")
-        return _compare_numbers(left, right, op)
-    return False
+        return compare(float(left), float(right))
 
-
-def _compare_numbers(left: Any, right: Any, op: str) -> bool:
-    left_num = float(left)
-    right_num = float(right)
-    if op == ">":
-        return left_num > right_num
-    elif op == "<":
-        return left_num < right_num
-    elif op == ">=":
-        return left_num >= right_num
-    elif op == "<=":
-        return left_num <= right_num
-    return False
+    return evaluate
 
 
 def _compare_equals(left: Any, right: Any) -> bool:
@@ -144,20 +185,28 @@ def _compare_equals(left: Any, right: Any) -> bool:
     return left == right
 
 
-def _evaluate_arithmetic(left: Any, right: Any, op: str) -> float:
-    left_num = _to_double(left)
-    right_num = _to_double(right)
-    if op == "+":
-        return left_num + right_num
-    elif op == "-":
-        return left_num - right_num
-    elif op == "*":
-        return left_num * right_num
-    elif op == "/":
-        if right_num == 0:
-            raise ArithmeticError("Division by zero")
-        return left_num / right_num
-    return 0.0
+def _divide(left: float, right: float) -> float:
+    if right == 0:
+        raise ArithmeticError("Division by zero")
+    return left / right
+
+
+# Operator text -> implementation, looked up once when an expression compiles
+_RELATIONAL_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": _equals,
+    "!=": _not_equals,
+    ">": _numeric_comparison(">", operator.gt),
+    "<": _numeric_comparison("<", operator.lt),
+    ">=": _numeric_comparison(">=", operator.ge),
+    "<=": _numeric_comparison("<=", operator.le),
+}
+
+_ARITHMETIC_OPS: dict[str, Callable[[float, float], float]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide,
+}
 
 
 def _to_double(obj: Any) -> float:
@@ -178,8 +227,12 @@ def _to_boolean(obj: Any) -> bool:
 
 def _unquote(quoted: str) -> str:
     if quoted.startswith('"') and quoted.endswith('"'):
+        body = quoted[1:-1]
+        if "\\" not in body:
+            # No escapes, the common case: skip the five replace() scans
+            return body
         return (
-            quoted[1:-1]
+            body
             .replace('\\"', '"')
             .replace("\\\\", "\\")
             .replace("\\n", "\n")
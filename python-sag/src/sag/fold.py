@@ -1,41 +1,45 @@
 from __future__ import annotations
 
 import hashlib
-import uuid
+import secrets
 from typing import Optional
 
+from sag.minifier import MessageMinifier
 from sag.model import FoldStatement, Message
 
 
 class FoldEngine:
     def __init__(self):
-        self._store: dict[str, list[Message]] = {}
+        # Tuples: a fold's messages cannot change, so unfold() can hand out
+        # the stored sequence without copying it
+        self._store: dict[str, tuple[Message, ...]] = {}
 
     def fold(self, messages: list[Message], summary: str, state: dict | None = None) -> FoldStatement:
-        fold_id = str(uuid.uuid4()).replace("-", "")[:16]
+        fold_id = secrets.token_hex(8)
 
-        self._store[fold_id] = list(messages)
+        self._store[fold_id] = tuple(messages)
 
         return FoldStatement(fold_id=fold_id, summary=summary, state=state)
 
-    def unfold(self, fold_id: str) -> Optional[list[Message]]:
-        messages = self._store.get(fold_id)
-        if messages is not None:
-            return list(messages)
-        return None
+    def unfold(self, fold_id: str) -> Optional[tuple[Message, ...]]:
+        # A tuple, not a list: callers that need to edit the messages copy them
+        return self._store.get(fold_id)
 
     def has_fold(self, fold_id: str) -> bool:
         return fold_id in self._store
 
     def detect_pressure(self, messages: list[Message], budget: int, threshold: float = 0.7) -> bool:
-        from sag.minifier import MessageMinifier
-
+        # MessageMinifier memoizes each message's wire form, so a repeated check only
+        # re-measures lengths; stop as soon as the limit is reached
+        limit = budget * threshold
         total_tokens = 0
         for msg in messages:
             minified = MessageMinifier.to_minified_string(msg)
             total_tokens += MessageMinifier.count_tokens(minified)
+            if total_tokens >= limit:
+                return True
 
-        return total_tokens >= budget * threshold
+        return total_tokens >= limit
 
     def get_fold_count(self) -> int:
         return len(self._store)
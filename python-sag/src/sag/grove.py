@@ -14,6 +14,8 @@ from __future__ import annotations
 
 import re
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional, Protocol, runtime_checkable
 
@@ -44,6 +46,9 @@ class AgentRunner(Protocol):
 # ---------------------------------------------------------------------------
 
 _ASSERT_RE = re.compile(r'A\s+([\w.]+)\s*=\s*"([^"]*)"')
+# The grammar requires a message body to open (after the header's newlines)
+# with a statement keyword and a space; replies that don't can never parse
+_SAG_BODY_START_RE = re.compile(r"[\r\n]*(?:A|DO|Q|IF|EVT|ERR|FOLD|RECALL|SUB|UNSUB|KNOW)[ \t]")
 
 
 class LLMAgentRunner:
@@ -52,6 +57,8 @@ class LLMAgentRunner:
     def __init__(self, client: LLMClient, max_tokens: int = 512) -> None:
         self._client = client
         self._max_tokens = max_tokens
+        # agent_id -> ((role prompt, topics), system prompt) it was built from
+        self._system_prompts: dict[str, tuple[tuple[str, tuple[str, ...]], str]] = {}
 
     def run(
         self, node: AgentNode, task: str, child_facts: dict[str, str]
@@ -72,7 +79,13 @@ class LLMAgentRunner:
 
     def _build_system_prompt(self, node: AgentNode) -> str:
         role_prompt = node.metadata.get("prompt", f"You are a {node.role}.")
-        topics = node.metadata.get("topics", [])
+        topics = tuple(node.metadata.get("topics", ()))
+
+        # Rebuilt only when the node's prompt or topics change
+        key = (role_prompt, topics)
+        cached = self._system_prompts.get(node.agent_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         builder = (
             PromptBuilder()
@@ -98,7 +111,9 @@ class LLMAgentRunner:
             )
 
         builder.set_suffix(topic_instruction)
-        return builder.build()
+        prompt = builder.build()
+        self._system_prompts[node.agent_id] = (key, prompt)
+        return prompt
 
     def _build_user_message(
         self, task: str, child_facts: dict[str, str]
@@ -114,28 +129,29 @@ class LLMAgentRunner:
         """Parse LLM response to extract assert facts.
 
         Strategy:
-        1. Try SAGMessageParser with synthetic header
+        1. Try SAGMessageParser with synthetic header, if the response starts
+           like a SAG statement (anything else is bound to fail the parse)
         2. Regex fallback for A topic = "value" patterns
         3. Last resort: wrap entire response as {role}.analysis
         """
         facts: dict[str, str] = {}
 
         # Strategy 1: full SAG parse with synthetic header
-        try:
-            header = f"H v 1 id={node.agent_id}-out src={node.agent_id} dst=parent ts={int(time.time())}"
-            full_text = f"{header}\n{raw}"
-            msg = SAGMessageParser.parse(full_text)
-            for stmt in msg.statements:
-                if isinstance(stmt, AssertStatement):
-                    facts[stmt.path] = str(stmt.value)
-            if facts:
-                return facts
-        except SAGParseException:
-            pass
+        if _SAG_BODY_START_RE.match(raw):
+            try:
+                header = f"H v 1 id={node.agent_id}-out src={node.agent_id} dst=parent ts={int(time.time())}"
+                full_text = f"{header}\n{raw}"
+                msg = SAGMessageParser.parse(full_text)
+                for stmt in msg.statements:
+                    if isinstance(stmt, AssertStatement):
+                        facts[stmt.path] = str(stmt.value)
+                if facts:
+                    return facts
+            except SAGParseException:
+                pass
 
         # Strategy 2: regex fallback
-        for match in _ASSERT_RE.finditer(raw):
-            facts[match.group(1)] = match.group(2)
+        facts.update(_ASSERT_RE.findall(raw))
         if facts:
             return facts
 
@@ -200,6 +216,77 @@ OnAgentDone = Callable[[AgentNode, dict[str, str]], None]
 OnPropagate = Callable[[AgentNode, AgentNode, Message], None]
 
 
+def _gather_child_facts(node: AgentNode) -> dict[str, str]:
+    child_facts: dict[str, str] = {}
+    for child in node.children:
+        for topic, (value, _ver) in child.knowledge.facts_view().items():
+            child_facts[topic] = value if isinstance(value, str) else str(value)
+    return child_facts
+
+
+def _run_level(
+    runner: AgentRunner,
+    level: list[AgentNode],
+    task: str,
+    on_agent_start: Optional[OnAgentStart],
+    max_workers: int,
+) -> Iterator[tuple[AgentNode, dict[str, str]]]:
+    """Run the agents of one level, yielding ``(node, facts)`` in level order.
+
+    Siblings only read their children's facts, so with ``max_workers > 1``
+    they are run concurrently on a thread pool. Callbacks still fire on the
+    calling thread: every start first, then each result as it is yielded.
+    """
+    if max_workers <= 1 or len(level) <= 1:
+        for node in level:
+            child_facts = _gather_child_facts(node)
+            if on_agent_start:
+                on_agent_start(node, task)
+            yield node, runner.run(node, task, child_facts)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(level))) as pool:
+        futures = []
+        for node in level:
+            child_facts = _gather_child_facts(node)
+            if on_agent_start:
+                on_agent_start(node, task)
+            futures.append(pool.submit(runner.run, node, task, child_facts))
+        for node, future in zip(level, futures):
+            yield node, future.result()
+
+
+def _finish_agent(
+    tree: TreeEngine,
+    node: AgentNode,
+    facts: dict[str, str],
+    message_log: list[Message],
+    on_agent_done: Optional[OnAgentDone],
+    on_propagate: Optional[OnPropagate],
+) -> Optional[Message]:
+    """Report a finished agent and propagate its knowledge to its parent.
+
+    Returns the SAG message sent up (also appended to ``message_log``), or
+    None if nothing was propagated.
+    """
+    if on_agent_done:
+        on_agent_done(node, facts)
+
+    parent = node.parent
+    if parent is None:
+        return None
+    applied = tree.propagate_up(node.agent_id)
+    if not applied:
+        return None
+    msg = _build_propagation_message(node, parent, applied)
+    message_log.append(msg)
+    # Parent records incoming for correlation
+    parent.correlation.record_incoming(msg)
+    if on_propagate:
+        on_propagate(node, parent, msg)
+    return msg
+
+
 # ---------------------------------------------------------------------------
 # Grove orchestrator
 # ---------------------------------------------------------------------------
@@ -214,6 +301,10 @@ class Grove:
       KNOW statements for each fact.
     - The parent records the incoming message for correlation tracking.
     - The full message log is captured in GroveResult.
+
+    Set ``max_workers`` above 1 to run the agents of each level concurrently
+    on threads (useful when the runner waits on an LLM API). The runner must
+    then be safe to call from several threads at once.
     """
 
     def __init__(
@@ -223,12 +314,14 @@ class Grove:
         on_agent_start: Optional[OnAgentStart] = None,
         on_agent_done: Optional[OnAgentDone] = None,
         on_propagate: Optional[OnPropagate] = None,
+        max_workers: int = 1,
     ) -> None:
         self._tree = tree
         self._runner = runner
         self._on_agent_start = on_agent_start
         self._on_agent_done = on_agent_done
         self._on_propagate = on_propagate
+        self._max_workers = max_workers
 
     def execute(self, task: str) -> GroveResult:
         """Execute the grove on a task, processing bottom-up."""
@@ -239,33 +332,14 @@ class Grove:
         agents_run = 0
 
         for level in levels:
-            for node in level:
-                # Gather child facts for this node
-                child_facts: dict[str, str] = {}
-                for child in node.children:
-                    for topic, (value, _ver) in child.knowledge.get_all_facts().items():
-                        child_facts[topic] = str(value)
-
-                if self._on_agent_start:
-                    self._on_agent_start(node, task)
-
-                # Run the agent
-                facts = self._runner.run(node, task, child_facts)
+            for node, facts in _run_level(
+                self._runner, level, task, self._on_agent_start, self._max_workers
+            ):
                 agents_run += 1
-
-                if self._on_agent_done:
-                    self._on_agent_done(node, facts)
-
-                # Propagate knowledge up via SAG message
-                if node.parent is not None:
-                    applied = self._tree.propagate_up(node.agent_id)
-                    if applied:
-                        msg = _build_propagation_message(node, node.parent, applied)
-                        message_log.append(msg)
-                        # Parent records incoming for correlation
-                        node.parent.correlation.record_incoming(msg)
-                        if self._on_propagate:
-                            self._on_propagate(node, node.parent, msg)
+                _finish_agent(
+                    self._tree, node, facts, message_log,
+                    self._on_agent_done, self._on_propagate,
+                )
 
         # Build result from root
         root = self._tree.get_root()
@@ -353,6 +427,7 @@ class InteractiveGrove:
         on_agent_start: Optional[OnAgentStart] = None,
         on_agent_done: Optional[OnAgentDone] = None,
         on_propagate: Optional[OnPropagate] = None,
+        max_workers: int = 1,
     ) -> None:
         self._tree = tree
         self._runner = runner
@@ -360,6 +435,7 @@ class InteractiveGrove:
         self._on_agent_start = on_agent_start
         self._on_agent_done = on_agent_done
         self._on_propagate = on_propagate
+        self._max_workers = max_workers
 
         self._task: str = ""
         self._levels: list[list[AgentNode]] = []
@@ -391,32 +467,18 @@ class InteractiveGrove:
         facts_produced: dict[str, dict[str, str]] = {}
         step_messages: list[Message] = []
 
-        for node in level:
-            child_facts: dict[str, str] = {}
-            for child in node.children:
-                for topic, (value, _ver) in child.knowledge.get_all_facts().items():
-                    child_facts[topic] = str(value)
-
-            if self._on_agent_start:
-                self._on_agent_start(node, self._task)
-
-            facts = self._runner.run(node, self._task, child_facts)
+        for node, facts in _run_level(
+            self._runner, level, self._task, self._on_agent_start, self._max_workers
+        ):
             self._agents_run += 1
             agents_run_ids.append(node.agent_id)
             facts_produced[node.agent_id] = facts
-
-            if self._on_agent_done:
-                self._on_agent_done(node, facts)
-
-            if node.parent is not None:
-                applied = self._tree.propagate_up(node.agent_id)
-                if applied:
-                    msg = _build_propagation_message(node, node.parent, applied)
-                    self._message_log.append(msg)
-                    step_messages.append(msg)
-                    node.parent.correlation.record_incoming(msg)
-                    if self._on_propagate:
-                        self._on_propagate(node, node.parent, msg)
+            msg = _finish_agent(
+                self._tree, node, facts, self._message_log,
+                self._on_agent_done, self._on_propagate,
+            )
+            if msg is not None:
+                step_messages.append(msg)
 
         self._current_level += 1
         is_complete = self._current_level >= len(self._levels)
@@ -558,8 +620,8 @@ class ChatSession:
 
         # Build context from root's current knowledge
         current_facts: dict[str, str] = {}
-        for topic, (value, _ver) in root.knowledge.get_all_facts().items():
-            current_facts[topic] = str(value)
+        for topic, (value, _ver) in root.knowledge.facts_view().items():
+            current_facts[topic] = value if isinstance(value, str) else str(value)
 
         # Include feedback as a special child_fact
         feedback_facts = dict(current_facts)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from sag.model import (
     FoldStatement,
@@ -185,6 +186,10 @@ class KnowledgeEngine:
     def get_all_facts(self) -> dict[str, tuple[Any, int]]:
         return dict(self._facts)
 
+    def facts_view(self) -> Mapping[str, tuple[Any, int]]:
+        """Read-only live view of the facts, for iterating without a copy."""
+        return MappingProxyType(self._facts)
+
     def get_fact_count(self) -> int:
         return len(self._facts)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from typing import Any, Optional
 
 from sag.model import (
@@ -44,9 +45,21 @@ class TokenComparison:
         )
 
 
+# Memoized to_minified_string() output, keyed on message identity. An entry
+# is dropped when its message is garbage collected, or by invalidate() after
+# the message (or a statement's args) is changed in place.
+_minified_cache: dict[int, str] = {}
+
+
 class MessageMinifier:
     @staticmethod
     def to_minified_string(message: Message, use_relative_timestamp: bool = False) -> str:
+        key = id(message)
+        if not use_relative_timestamp:
+            cached = _minified_cache.get(key)
+            if cached is not None:
+                return cached
+
         parts: list[str] = []
 
         header = message.header
@@ -66,12 +79,26 @@ class MessageMinifier:
             if i < len(stmts) - 1:
                 parts.append(";")
 
-        return "".join(parts)
+        minified = "".join(parts)
+        if not use_relative_timestamp:
+            if key not in _minified_cache:
+                weakref.finalize(message, _minified_cache.pop, key, None)
+            _minified_cache[key] = minified
+        return minified
+
+    @staticmethod
+    def invalidate(message: Message) -> None:
+        """Forget the memoized string of a message that was changed in place."""
+        _minified_cache.pop(id(message), None)
 
     @staticmethod
     def count_tokens(sag_message: str) -> int:
-        import math
-        return math.ceil(len(sag_message) / 4.0)
+        # chars/4 estimate, rounded up with integer arithmetic
+        return -(-len(sag_message) // 4)
+
+    @staticmethod
+    def count_tokens_batch(sag_messages: list[str]) -> list[int]:
+        return [-(-len(m) // 4) for m in sag_messages]
 
     @staticmethod
     def compare_with_json(message: Message) -> TokenComparison:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.error.ErrorListener import ErrorListener
 
@@ -41,3 +43,31 @@ class SAGMessageParser:
             raise
         except Exception as e:
             raise SAGParseException(f"Failed to parse SAG message: {e}", cause=e) from e
+
+    @staticmethod
+    def parse_all(texts: Iterable[str]) -> list[Message]:
+        """Parse a batch of messages with a single lexer/parser pair.
+
+        Equivalent to ``[parse(t) for t in texts]`` but avoids rebuilding
+        the lexer, parser and visitor for every message.
+        """
+        try:
+            lexer = SAGLexer(None)
+            lexer.removeErrorListeners()
+            lexer.addErrorListener(_ThrowingErrorListener.INSTANCE)
+
+            parser = SAGParser(None)
+            parser.removeErrorListeners()
+            parser.addErrorListener(_ThrowingErrorListener.INSTANCE)
+
+            visitor = SAGModelVisitor()
+            messages = []
+            for text in texts:
+                lexer.inputStream = InputStream(text)
+                parser.setTokenStream(CommonTokenStream(lexer))
+                messages.append(visitor.visit(parser.message()))
+            return messages
+        except SAGParseException:
+            raise
+        except Exception as e:
+            raise SAGParseException(f"Failed to parse SAG message: {e}", cause=e) from e
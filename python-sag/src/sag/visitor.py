@@ -260,8 +260,12 @@ class SAGModelVisitor(SAGVisitor):
 
 def _unquote(quoted: str) -> str:
     if quoted.startswith('"') and quoted.endswith('"'):
+        body = quoted[1:-1]
+        if "\\" not in body:
+            # No escapes, the common case: skip the five replace() scans
+            return body
         return (
-            quoted[1:-1]
+            body
             .replace('\\"', '"')
             .replace("\\\\", "\\")
             .replace("\\n", "\n")
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from sag.checkpoint import CheckpointManager
 from sag.tree import TreeEngine
 from sag.grove import EchoAgentRunner, Grove
@@ -89,6 +93,59 @@ def test_load_nonexistent_raises(tmp_path):
         pass
 
 
+def test_load_reads_facts_in_either_layout(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    meta = CheckpointManager(tmp_path).save(tree, "test", result.messages, result.agents_run, 2, 2)
+    path = tmp_path / f"{meta.checkpoint_id}.json"
+    data = json.loads(path.read_text())
+    assert isinstance(data["node_snapshots"]["a"]["facts"], list)
+
+    # Older checkpoints stored {topic: [value, version]}
+    for snap in data["node_snapshots"].values():
+        packed = snap["facts"]
+        snap["facts"] = {t: [v, ver] for t, v, ver in zip(packed[::3], packed[1::3], packed[2::3])}
+    path.write_text(json.dumps(data))
+
+    loaded = CheckpointManager(tmp_path).load(meta.checkpoint_id)
+    for agent_id, snap in meta.node_snapshots.items():
+        assert loaded.node_snapshots[agent_id].facts == snap.facts
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_values_orjson_refuses_round_trip_either_way(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("sag.checkpoint.orjson", None)
+    tree = _build_simple_tree()
+    big = 2**70 + 1
+    tree.get_node("a").knowledge.assert_fact("a.result", {1: "one", "big": big})
+
+    meta = CheckpointManager(tmp_path).save(tree, "test", [], 0, 2, 2)
+    monkeypatch.undo()
+    loaded = CheckpointManager(tmp_path).load(meta.checkpoint_id)
+
+    value = loaded.node_snapshots["a"].facts["a.result"][0]
+    assert value == {"1": "one", "big": big}
+    assert isinstance(value["big"], int)
+
+
+def test_large_checkpoint_loads_through_mmap(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr("sag.checkpoint.MMAP_MIN_BYTES", 1)
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    meta = CheckpointManager(tmp_path).save(tree, "test", result.messages, result.agents_run, 2, 2)
+    loaded = CheckpointManager(tmp_path).load(meta.checkpoint_id)
+
+    assert loaded.messages == meta.messages
+    for agent_id, snap in meta.node_snapshots.items():
+        assert loaded.node_snapshots[agent_id].facts == snap.facts
+    listed = CheckpointManager(tmp_path).list_checkpoints()
+    assert [m.checkpoint_id for m in listed] == [meta.checkpoint_id]
+
+
 # --- Restore ---
 
 
@@ -155,6 +212,249 @@ def test_list_empty(tmp_path):
     assert mgr.list_checkpoints() == []
 
 
+def test_load_serves_recent_checkpoints_from_memory(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path)
+    meta = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    # Remove the file behind the manager's back: the cached copy still loads
+    (tmp_path / f"{meta.checkpoint_id}.json").unlink()
+    assert mgr.load(meta.checkpoint_id).node_snapshots.keys() == meta.node_snapshots.keys()
+
+    uncached = CheckpointManager(tmp_path, cache_size=0)
+    meta2 = uncached.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    (tmp_path / f"{meta2.checkpoint_id}.json").unlink()
+    with pytest.raises(FileNotFoundError):
+        uncached.load(meta2.checkpoint_id)
+
+
+def test_changing_a_loaded_checkpoint_leaves_the_cache_intact(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path)
+    meta = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    original = meta.node_snapshots["a"].facts["a.result"]
+
+    meta.node_snapshots["a"].facts["a.result"] = ("tampered", 99)
+    loaded = mgr.load(meta.checkpoint_id)
+    assert loaded.node_snapshots["a"].facts["a.result"] == original
+    loaded.node_snapshots["a"].facts["a.result"] = ("tampered", 99)
+    del loaded.node_snapshots["b"]
+    mgr.restore(loaded, tree)
+
+    # The delta is taken against what is on disk, so it records node a
+    second = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    assert _stored_nodes(tmp_path, second.checkpoint_id) == {"a"}
+    reloaded = CheckpointManager(tmp_path).load(second.checkpoint_id)
+    assert reloaded.node_snapshots["a"].facts["a.result"][0] == "tampered"
+    assert mgr.load(meta.checkpoint_id).node_snapshots["a"].facts["a.result"] == original
+
+
+def test_cache_evicts_least_recent(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path, cache_size=2)
+    ids = [mgr.save(tree, "test", result.messages, result.agents_run, 2, 2).checkpoint_id for _ in range(3)]
+    for cp_id in ids:
+        (tmp_path / f"{cp_id}.json").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        mgr.load(ids[0])
+    mgr.load(ids[1])
+    mgr.load(ids[2])
+
+
+# --- Incremental checkpoints ---
+
+
+def _stored_nodes(tmp_path, checkpoint_id: str) -> set[str]:
+    data = json.loads((tmp_path / f"{checkpoint_id}.json").read_text())
+    return set(data["node_snapshots"])
+
+
+def test_second_save_stores_only_changed_nodes(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path)
+    first = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    tree.get_node("a").knowledge.assert_fact("a.result", "revised")
+    second = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    assert first.parent_checkpoint_id is None
+    assert second.parent_checkpoint_id == first.checkpoint_id
+    assert _stored_nodes(tmp_path, second.checkpoint_id) == {"a"}
+
+    # A fresh manager reassembles the full state from the chain
+    loaded = CheckpointManager(tmp_path).load(second.checkpoint_id)
+    assert set(loaded.node_snapshots) == {"root", "a", "b"}
+    assert loaded.node_snapshots["a"].facts["a.result"][0] == "revised"
+    listed = {m.checkpoint_id: m for m in CheckpointManager(tmp_path).list_checkpoints()}
+    assert set(listed[second.checkpoint_id].node_snapshots) == {"root", "a", "b"}
+
+
+def test_full_every_bounds_chain_length(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path, full_every=2)
+    metas = [mgr.save(tree, "test", result.messages, result.agents_run, 2, 2) for _ in range(3)]
+
+    assert metas[1].parent_checkpoint_id == metas[0].checkpoint_id
+    assert metas[2].parent_checkpoint_id is None
+    assert _stored_nodes(tmp_path, metas[2].checkpoint_id) == {"root", "a", "b"}
+
+
+def test_save_with_different_node_set_writes_full_checkpoint(tmp_path):
+    mgr = CheckpointManager(tmp_path)
+    first_tree = TreeEngine()
+    first_tree.add_root("r", "PM")
+    first_tree.add_child("r", "a", "Agent A")
+    mgr.save(first_tree, "test", [], 0, 0, 1)
+
+    second_tree = TreeEngine()
+    second_tree.add_root("r", "PM")
+    second_tree.add_child("r", "b", "Agent B")
+    second = mgr.save(second_tree, "test", [], 0, 0, 1)
+
+    assert second.parent_checkpoint_id is None
+    assert _stored_nodes(tmp_path, second.checkpoint_id) == {"r", "b"}
+    loaded = CheckpointManager(tmp_path).load(second.checkpoint_id)
+    assert set(loaded.node_snapshots) == {"r", "b"}
+
+
+def test_save_after_rollback_builds_on_restored_checkpoint(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path)
+    first = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    tree.get_node("a").knowledge.assert_fact("a.result", "v2")
+    mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    mgr.restore(mgr.load(first.checkpoint_id), tree)
+    tree.get_node("b").knowledge.assert_fact("b.result", "v2")
+    third = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    assert third.parent_checkpoint_id == first.checkpoint_id
+    assert _stored_nodes(tmp_path, third.checkpoint_id) == {"b"}
+    loaded = CheckpointManager(tmp_path).load(third.checkpoint_id)
+    assert loaded.node_snapshots["a"].facts["a.result"][0] != "v2"
+
+
+def test_list_resolves_long_delta_chains(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path, full_every=10_000)
+    for i in range(1200):
+        tree.get_node("a").knowledge.assert_fact("a.result", f"v{i}")
+        last = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    listed = CheckpointManager(tmp_path).list_checkpoints()
+    assert len(listed) == 1200
+    assert listed[-1].checkpoint_id == last.checkpoint_id
+    assert listed[-1].node_snapshots["a"].facts["a.result"][0] == "v1199"
+
+
+def test_list_skips_chains_that_cycle(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path)
+    first = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    tree.get_node("a").knowledge.assert_fact("a.result", "revised")
+    second = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    path = tmp_path / f"{first.checkpoint_id}.json"
+    data = json.loads(path.read_text())
+    data["parent_checkpoint_id"] = second.checkpoint_id
+    path.write_text(json.dumps(data))
+
+    assert CheckpointManager(tmp_path).list_checkpoints() == []
+
+
+def test_delete_parent_keeps_children_loadable(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path)
+    first = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    tree.get_node("a").knowledge.assert_fact("a.result", "revised")
+    second = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    mgr.delete(first.checkpoint_id)
+
+    loaded = CheckpointManager(tmp_path).load(second.checkpoint_id)
+    assert loaded.parent_checkpoint_id is None
+    assert set(loaded.node_snapshots) == {"root", "a", "b"}
+
+
+def test_background_saves_are_on_disk_after_flush(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path, background=True)
+    first = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    tree.get_node("a").knowledge.assert_fact("a.result", "revised")
+    second = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    mgr.flush()
+
+    assert second.parent_checkpoint_id == first.checkpoint_id
+    assert _stored_nodes(tmp_path, second.checkpoint_id) == {"a"}
+    loaded = CheckpointManager(tmp_path).load(second.checkpoint_id)
+    assert loaded.node_snapshots["a"].facts["a.result"][0] == "revised"
+
+
+def test_background_write_error_raised_on_flush(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path / "cps", background=True)
+    (tmp_path / "cps").rmdir()
+    mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    with pytest.raises(OSError):
+        mgr.flush()
+    mgr.flush()  # reported once
+
+
+def test_save_after_failed_background_write_still_writes(tmp_path):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    mgr = CheckpointManager(tmp_path / "cps", background=True)
+    (tmp_path / "cps").rmdir()
+    mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    with mgr._writes:
+        while mgr._writer_thread is not None:
+            mgr._writes.wait()
+    (tmp_path / "cps").mkdir()
+
+    # The earlier error is not this save's: it queues and is written
+    second = mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+    with pytest.raises(OSError):
+        mgr.flush()
+    assert (tmp_path / "cps" / f"{second.checkpoint_id}.json").exists()
+
+
+def test_failed_write_leaves_no_partial_file(tmp_path, monkeypatch):
+    tree = _build_simple_tree()
+    result = _run_grove(tree)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("sag.checkpoint.os.replace", fail)
+    mgr = CheckpointManager(tmp_path)
+    with pytest.raises(OSError):
+        mgr.save(tree, "test", result.messages, result.agents_run, 2, 2)
+
+    assert list(tmp_path.iterdir()) == []
+
+
 # --- Delete ---
 
 
@@ -168,6 +468,8 @@ def test_delete_checkpoint(tmp_path):
     mgr.delete(meta.checkpoint_id)
     assert not (tmp_path / f"{meta.checkpoint_id}.json").exists()
     assert len(mgr.list_checkpoints()) == 0
+    with pytest.raises(FileNotFoundError):
+        mgr.load(meta.checkpoint_id)
 
 
 def test_delete_nonexistent_is_silent(tmp_path):
@@ -1,5 +1,5 @@
 from sag.parser import SAGMessageParser
-from sag.correlation import CorrelationEngine
+from sag.correlation import CorrelationEngine, CorrelationIndex
 from sag.model import Header, Message
 
 
@@ -64,6 +64,17 @@ def test_trace_thread():
     assert thread[2].header.message_id == "msg3"
 
 
+def test_trace_thread_stops_at_cycle():
+    msg1 = SAGMessageParser.parse("H v 1 id=msg1 src=agent1 dst=agent2 ts=1000 corr=msg3\nDO start()")
+    msg2 = SAGMessageParser.parse("H v 1 id=msg2 src=agent2 dst=agent3 ts=2000 corr=msg1\nDO process()")
+    msg3 = SAGMessageParser.parse("H v 1 id=msg3 src=agent3 dst=agent1 ts=3000 corr=msg2\nDO finish()")
+    extra = SAGMessageParser.parse("H v 1 id=msg4 src=agent1 dst=agent2 ts=4000\nDO other()")
+
+    thread = CorrelationEngine.trace_thread([msg1, msg2, msg3, extra], "msg3")
+
+    assert [m.header.message_id for m in thread] == ["msg1", "msg2", "msg3"]
+
+
 def test_find_responses():
     msg1 = SAGMessageParser.parse("H v 1 id=msg1 src=agent1 dst=agent2 ts=1000\nDO start()")
     msg2 = SAGMessageParser.parse("H v 1 id=msg2 src=agent2 dst=agent3 ts=2000 corr=msg1\nDO process()")
@@ -78,6 +89,24 @@ def test_find_responses():
     assert "msg3" in response_ids
 
 
+def test_correlation_index_queries_match_scans():
+    msg1 = SAGMessageParser.parse("H v 1 id=msg1 src=agent1 dst=agent2 ts=1000\nDO start()")
+    msg2 = SAGMessageParser.parse("H v 1 id=msg2 src=agent2 dst=agent3 ts=2000 corr=msg1\nDO process()")
+    msg3 = SAGMessageParser.parse("H v 1 id=msg3 src=agent3 dst=agent1 ts=3000 corr=msg1\nDO finish()")
+    msg4 = SAGMessageParser.parse("H v 1 id=msg4 src=agent1 dst=agent2 ts=4000 corr=msg2\nDO acknowledge()")
+
+    all_messages = [msg1, msg2, msg3, msg4]
+    index = CorrelationIndex.build(all_messages)
+
+    assert index.by_id["msg3"] is msg3
+    assert CorrelationEngine.find_responses(all_messages, "msg1", index) == [msg2, msg3]
+    assert CorrelationEngine.find_responses(all_messages, "msg4", index) == []
+    assert CorrelationEngine.trace_thread(all_messages, "msg4", index) == [msg1, msg2, msg4]
+    assert CorrelationEngine.trace_thread(all_messages, "msg4", index) == (
+        CorrelationEngine.trace_thread(all_messages, "msg4")
+    )
+
+
 def test_build_conversation_tree():
     msg1 = SAGMessageParser.parse("H v 1 id=msg1 src=agent1 dst=agent2 ts=1000\nDO start()")
     msg2 = SAGMessageParser.parse("H v 1 id=msg2 src=agent2 dst=agent3 ts=2000 corr=msg1\nDO process()")
@@ -1,3 +1,6 @@
+import pytest
+
+from sag.exceptions import SAGParseException
 from sag.expression import ExpressionEvaluator
 from sag.context import MapContext
 
@@ -93,3 +96,41 @@ def test_evaluate_null_value():
 
     assert isinstance(result, bool)
     assert result is True
+
+
+def test_repeated_expression_reads_each_context():
+    low = MapContext()
+    low.set("balance", 400)
+    high = MapContext()
+    high.set("balance", 1500)
+
+    assert ExpressionEvaluator.evaluate("balance > 1000", high) is True
+    assert ExpressionEvaluator.evaluate("balance > 1000", low) is False
+    assert ExpressionEvaluator.evaluate("balance  >  1000", high) is True
+
+
+def test_constant_subexpressions_evaluate_like_paths():
+    context = MapContext()
+    context.set("price", 60)
+    context.set("limit", 50)
+
+    assert ExpressionEvaluator.evaluate("price > (10 * 5)", context) is True
+    assert ExpressionEvaluator.evaluate("price > limit", context) is True
+    assert ExpressionEvaluator.evaluate("(10 * 5) == limit", context) is True
+
+
+def test_constant_division_by_zero_raises_on_evaluate():
+    with pytest.raises(SAGParseException):
+        ExpressionEvaluator.evaluate("1 / 0", MapContext())
+
+
+def test_logical_operators_skip_right_side_when_left_decides():
+    context = MapContext()
+    context.set("verified", True)
+    context.set("status", "active")
+
+    # The right-hand side would raise: ordering comparison on a string
+    assert ExpressionEvaluator.evaluate('(verified == true) || (status > 1)', context) is True
+    assert ExpressionEvaluator.evaluate('(verified == false) && (status > 1)', context) is False
+    with pytest.raises(SAGParseException):
+        ExpressionEvaluator.evaluate('(verified == false) || (status > 1)', context)
@@ -96,6 +96,22 @@ def test_fold_engine_fold_unfold():
     assert original[1].header.message_id == "msg2"
 
 
+def test_fold_engine_fold_is_independent_of_input_list():
+    engine = FoldEngine()
+    msg1 = SAGMessageParser.parse("H v 1 id=msg1 src=a dst=b ts=1000\nDO start()")
+    msg2 = SAGMessageParser.parse("H v 1 id=msg2 src=b dst=a ts=2000\nDO process()")
+
+    messages = [msg1]
+    fold_stmt = engine.fold(messages, "Startup")
+    messages.append(msg2)
+    unfolded = engine.unfold(fold_stmt.fold_id)
+
+    assert isinstance(unfolded, tuple)
+    assert unfolded is not messages
+    assert unfolded == (msg1,)
+    assert engine.unfold(fold_stmt.fold_id) is unfolded
+
+
 def test_fold_engine_unfold_unknown():
     engine = FoldEngine()
     result = engine.unfold("nonexistent")
@@ -1,3 +1,5 @@
+import threading
+
 from sag.tree import AgentNode, TreeEngine
 from sag.grove import (
     EchoAgentRunner,
@@ -7,6 +9,7 @@ from sag.grove import (
 )
 from sag.model import KnowledgeStatement, Message
 from sag.minifier import MessageMinifier
+from sag.parser import SAGMessageParser
 
 
 def _build_simple_tree() -> TreeEngine:
@@ -239,6 +242,47 @@ def test_grove_child_facts_passed_to_parent():
     assert "b.result" in received_child_facts
 
 
+# --- Parallel siblings ---
+
+
+def test_grove_parallel_matches_sequential():
+    sequential = Grove(_build_deep_tree(), EchoAgentRunner()).execute("test")
+    parallel = Grove(_build_deep_tree(), EchoAgentRunner(), max_workers=4).execute("test")
+
+    assert parallel.facts == sequential.facts
+    assert parallel.agents_run == sequential.agents_run
+    assert [m.header.destination for m in parallel.messages] == [
+        m.header.destination for m in sequential.messages
+    ]
+
+
+def test_grove_parallel_runs_siblings_concurrently():
+    """Both leaves must be inside run() at once to pass the barrier."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierRunner(EchoAgentRunner):
+        def run(self, node, task, child_facts):
+            if node.is_leaf:
+                barrier.wait()
+            return super().run(node, task, child_facts)
+
+    started = []
+    done = []
+    grove = Grove(
+        _build_simple_tree(),
+        BarrierRunner(),
+        on_agent_start=lambda node, task: started.append(node.agent_id),
+        on_agent_done=lambda node, facts: done.append(node.agent_id),
+        max_workers=2,
+    )
+    result = grove.execute("test")
+
+    assert result.agents_run == 3
+    # Callbacks keep level order
+    assert started == ["a", "b", "root"]
+    assert done == ["a", "b", "root"]
+
+
 # --- GroveResult ---
 
 
@@ -373,6 +417,19 @@ def test_llm_runner_parse_facts_regex_fallback():
     assert facts["test.result"] == "everything looks good"
 
 
+def test_llm_runner_parse_facts_skips_parser_for_prose(monkeypatch):
+    """Responses that cannot be a SAG body never reach the ANTLR parser."""
+    runner = LLMAgentRunner.__new__(LLMAgentRunner)
+    node = AgentNode(agent_id="test", role="Tester")
+
+    def fail_parse(text):
+        raise AssertionError("parser should not run")
+
+    monkeypatch.setattr(SAGMessageParser, "parse", staticmethod(fail_parse))
+    raw = 'Analysis follows.\nA test.result = "fine"'
+    assert runner._parse_facts(raw, node) == {"test.result": "fine"}
+
+
 def test_llm_runner_parse_facts_last_resort():
     """When no patterns match, wraps entire response."""
     runner = LLMAgentRunner.__new__(LLMAgentRunner)
@@ -382,3 +439,16 @@ def test_llm_runner_parse_facts_last_resort():
     facts = runner._parse_facts(raw, node)
     assert "test_agent.analysis" in facts
     assert raw.strip() in facts["test_agent.analysis"]
+
+
+def test_llm_runner_system_prompt_rebuilt_only_on_change():
+    runner = LLMAgentRunner(client=None)
+    node = AgentNode(agent_id="test", role="Tester", metadata={"topics": ["test.result"]})
+
+    first = runner._build_system_prompt(node)
+    assert runner._build_system_prompt(node) is first
+
+    node.metadata["topics"] = ["test.coverage"]
+    updated = runner._build_system_prompt(node)
+    assert "test.coverage" in updated
+    assert "test.result" not in updated
@@ -1,3 +1,5 @@
+import pytest
+
 from sag.parser import SAGMessageParser
 from sag.minifier import MessageMinifier
 from sag.model import (
@@ -453,6 +455,18 @@ def test_engine_get_all_facts_returns_copy():
     assert engine.get_fact("b") is None
 
 
+def test_engine_facts_view_is_live_and_read_only():
+    engine = KnowledgeEngine("agent-a")
+    engine.assert_fact("a", 1)
+
+    view = engine.facts_view()
+    engine.assert_fact("b", 2)
+
+    assert view["b"] == (2, 2)
+    with pytest.raises(TypeError):
+        view["c"] = (3, 99)
+
+
 # --- KnowledgeEngine: clear ---
 
 
@@ -64,6 +64,30 @@ def test_minify_error():
     assert 'ERR TIMEOUT "Connection timed out"' in minified
 
 
+def test_minified_string_is_cached():
+    text = 'H v 1 id=msg1 src=svc1 dst=svc2 ts=1234567890\nDO deploy("app1", version=2)'
+    message = SAGMessageParser.parse(text)
+
+    first = MessageMinifier.to_minified_string(message)
+    assert MessageMinifier.to_minified_string(message) is first
+    assert message == SAGMessageParser.parse(text)
+
+
+def test_invalidate_picks_up_in_place_changes():
+    text = 'H v 1 id=msg1 src=svc1 dst=svc2 ts=1234567890\nDO deploy("app1", version=2)'
+    message = SAGMessageParser.parse(text)
+    before = MessageMinifier.to_minified_string(message)
+
+    action = message.statements[0]
+    action.args[0] = "app2"
+    action.named_args["version"] = 3
+    MessageMinifier.invalidate(message)
+    after = MessageMinifier.to_minified_string(message)
+
+    assert after != before
+    assert 'DO deploy("app2",version=3)' in after
+
+
 def test_token_counting():
     message = "H v 1 id=msg1 src=svc1 dst=svc2 ts=1234567890\nDO deploy()"
     tokens = MessageMinifier.count_tokens(message)
@@ -72,6 +96,12 @@ def test_token_counting():
     assert 13 <= tokens <= 17
 
 
+def test_token_counting_batch():
+    messages = ["", "abc", "abcd", "H v 1 id=msg1 src=svc1 dst=svc2 ts=1234567890\nDO deploy()"]
+    assert MessageMinifier.count_tokens_batch(messages) == [MessageMinifier.count_tokens(m) for m in messages]
+    assert MessageMinifier.count_tokens_batch([]) == []
+
+
 def test_compare_with_json():
     text = 'H v 1 id=msg1 src=svc1 dst=svc2 ts=1234567890\nDO deploy("app1")'
     message = SAGMessageParser.parse(text)
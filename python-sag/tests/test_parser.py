@@ -185,3 +185,25 @@ def test_invalid_syntax():
     text = "H v 1 invalid syntax\nDO test()"
     with pytest.raises(SAGParseException):
         SAGMessageParser.parse(text)
+
+
+def test_parse_all_matches_parse():
+    texts = [
+        "H v 1 id=msg1 src=svc1 dst=svc2 ts=1\nDO deploy(\"app\", 3)",
+        "H v 1 id=msg2 src=svc2 dst=svc1 ts=2 corr=msg1\nA status.ready = true",
+        "H v 1 id=msg3 src=svc1 dst=svc2 ts=3\nQ status WHERE healthy==true",
+    ]
+    assert SAGMessageParser.parse_all(texts) == [SAGMessageParser.parse(t) for t in texts]
+
+
+def test_parse_all_empty():
+    assert SAGMessageParser.parse_all([]) == []
+
+
+def test_parse_all_invalid_syntax():
+    texts = [
+        "H v 1 id=msg1 src=svc1 dst=svc2 ts=1\nDO test()",
+        "H v 1 invalid syntax\nDO test()",
+    ]
+    with pytest.raises(SAGParseException):
+        SAGMessageParser.parse_all(texts)
@@ -46,14 +46,12 @@ public class ExpressionEvaluator {
     private static Object evaluateExpr(SAGParser.ExprContext ctx, Context context) {
         if (ctx instanceof SAGParser.OrExprContext) {
             SAGParser.OrExprContext orCtx = (SAGParser.OrExprContext) ctx;
-            Object left = evaluateExpr(orCtx.left, context);
-            Object right = evaluateExpr(orCtx.right, context);
-            return toBoolean(left) || toBoolean(right);
+            return toBoolean(evaluateExpr(orCtx.left, context))
+                || toBoolean(evaluateExpr(orCtx.right, context));
         } else if (ctx instanceof SAGParser.AndExprContext) {
             SAGParser.AndExprContext andCtx = (SAGParser.AndExprContext) ctx;
-            Object left = evaluateExpr(andCtx.left, context);
-            Object right = evaluateExpr(andCtx.right, context);
-            return toBoolean(left) && toBoolean(right);
+            return toBoolean(evaluateExpr(andCtx.left, context))
+                && toBoolean(evaluateExpr(andCtx.right, context));
         } else if (ctx instanceof SAGParser.RelExprContext) {
             SAGParser.RelExprContext relCtx = (SAGParser.RelExprContext) ctx;
             Object left = evaluateExpr(relCtx.left, context);
@@ -106,4 +106,17 @@ class ExpressionEvaluatorTest {
         assertTrue(result instanceof Boolean);
         assertTrue((Boolean) result);
     }
+    
+    @Test
+    void testLogicalOperatorsSkipRightSideWhenLeftDecides() throws SAGParseException {
+        MapContext context = new MapContext();
+        context.set("verified", true);
+        context.set("status", "active");
+        
+        // The right-hand side would throw: ordering comparison on a string
+        assertEquals(true, ExpressionEvaluator.evaluate("(verified == true) || (status > 1)", context));
+        assertEquals(false, ExpressionEvaluator.evaluate("(verified == false) && (status > 1)", context));
+        assertThrows(SAGParseException.class,
+                () -> ExpressionEvaluator.evaluate("(verified == false) || (status > 1)", context));
+    }
 }